@@ -4,12 +4,21 @@ Tools call the Solo Bank web backend REST API to read/write data.
 Deployed in agentgateway-system and proxied through AgentGateway.
 """
 
+import asyncio
+import functools
 import os
-import json
 import httpx
+import orjson
+from cachetools import TTLCache
 from mcp.server.fastmcp import FastMCP
 
 BANK_API_URL = os.environ.get("BANK_API_URL", "http://solo-bank-web.kagent.svc.cluster.local:8080")
+# Same switch as the agent's BANK_API_HTTP2 (see src/config.py)
+BANK_API_HTTP2 = os.environ.get("BANK_API_HTTP2", "true").lower() in ("1", "true")
+
+# Tool results are read by an LLM, so compact JSON is the default; set
+# MCP_JSON_INDENT=1 to pretty-print while debugging.
+_DUMPS_OPTION = orjson.OPT_INDENT_2 if os.environ.get("MCP_JSON_INDENT", "").lower() in ("1", "true") else 0
 
 mcp = FastMCP(
     "Bank MCP Server",
@@ -19,102 +28,181 @@ mcp = FastMCP(
 )
 
 
-def _bank_api(method: str, path: str, body: dict | None = None) -> dict | list:
-    with httpx.Client(base_url=BANK_API_URL, timeout=15.0) as client:
-        if method == "GET":
-            resp = client.get(path)
-        else:
-            resp = client.post(path, json=body)
-        resp.raise_for_status()
-        return resp.json()
+# Shared keep-alive pool so tool calls reuse connections to the bank backend
+# instead of paying a TCP (and TLS) handshake per request. Async so tools
+# can fan out independent GETs concurrently.
+_ACLIENT = httpx.AsyncClient(
+    base_url=BANK_API_URL,
+    timeout=15.0,
+    http2=BANK_API_HTTP2,
+    limits=httpx.Limits(max_keepalive_connections=32, max_connections=64),
+)
+
+
+_JSON_HEADERS = {"Content-Type": "application/json"}
+
+
+def _dumps(obj) -> str:
+    return orjson.dumps(obj, option=_DUMPS_OPTION).decode()
+
+
+async def _abank_api(method: str, path: str, body: dict | None = None) -> dict | list:
+    if method == "GET":
+        resp = await _ACLIENT.get(path)
+    else:
+        resp = await _ACLIENT.post(path, content=orjson.dumps(body), headers=_JSON_HEADERS)
+    resp.raise_for_status()
+    return orjson.loads(resp.content)
+
+
+# Results of read-only calls, keyed on (function, args): the final JSON strings
+# of tools (a hit skips both the backend round-trip and serialization) and the
+# customer roster behind "not found" replies. One cache, so a write through
+# this server only has to clear it.
+_RESULT_CACHE: TTLCache = TTLCache(maxsize=512, ttl=15)
+
+
+def _invalidate() -> None:
+    """Drop cached reads after a write made through this server."""
+    _RESULT_CACHE.clear()
+
+
+def _cache_str(fn):
+    @functools.wraps(fn)
+    async def wrapper(*args, **kwargs):
+        key = (fn.__name__, args, tuple(sorted(kwargs.items())))
+        try:
+            return _RESULT_CACHE[key]
+        except KeyError:
+            pass
+        result = await fn(*args, **kwargs)
+        _RESULT_CACHE[key] = result
+        return result
+    return wrapper
+
+
+@_cache_str
+async def _customers() -> list[dict]:
+    # Shared with other callers through the cache: read, don't mutate
+    return await _abank_api("GET", "/api/customers")
+
+
+async def _not_found(customer_id: str) -> str:
+    ids = ", ".join(c["id"] for c in await _customers())
+    return f"Customer {customer_id} not found. Valid IDs: {ids}"
 
 
 @mcp.tool()
-def get_customer_profile(customer_id: str) -> str:
+@_cache_str
+async def get_customer_profile(customer_id: str) -> str:
     """Look up a customer's profile including name, income, credit score, and account info.
 
     Args:
         customer_id: The customer ID (e.g. CUST-1001)
     """
     try:
-        customer = _bank_api("GET", f"/api/customers/{customer_id}")
-        accounts = _bank_api("GET", f"/api/customers/{customer_id}/accounts")
-        return json.dumps({"customer": customer, "accounts": accounts}, indent=2)
+        customer, accounts = await asyncio.gather(
+            _abank_api("GET", f"/api/customers/{customer_id}"),
+            _abank_api("GET", f"/api/customers/{customer_id}/accounts"),
+        )
+        return _dumps({"customer": customer, "accounts": accounts})
     except httpx.HTTPStatusError as e:
         if e.response.status_code == 404:
-            customers = _bank_api("GET", "/api/customers")
-            ids = ", ".join(c["id"] for c in customers)
-            return f"Customer {customer_id} not found. Valid IDs: {ids}"
+            return await _not_found(customer_id)
         raise
 
 
 @mcp.tool()
-def get_credit_score(customer_id: str) -> str:
+@_cache_str
+async def get_customer_bundle(customer_id: str) -> str:
+    """Retrieve everything needed to assess a customer in one call: profile,
+    accounts, recent transactions, payment history, and credit limit history.
+    Prefer this over calling the individual lookup tools one by one.
+
+    Args:
+        customer_id: The customer ID (e.g. CUST-1001)
+    """
+    try:
+        bundle = await _abank_api("GET", f"/api/customers/{customer_id}/bundle")
+        return _dumps(bundle)
+    except httpx.HTTPStatusError as e:
+        if e.response.status_code == 404:
+            return await _not_found(customer_id)
+        raise
+
+
+@mcp.tool()
+@_cache_str
+async def get_credit_score(customer_id: str) -> str:
     """Retrieve a customer's credit score and credit history metrics.
 
     Args:
         customer_id: The customer ID (e.g. CUST-1001)
     """
-    customer = _bank_api("GET", f"/api/customers/{customer_id}")
-    return json.dumps({
+    customer = await _abank_api("GET", f"/api/customers/{customer_id}")
+    return _dumps({
         "customer_id": customer["id"],
         "credit_score": customer["credit_score"],
         "recent_inquiries": customer["recent_inquiries"],
         "delinquencies_last_2y": customer["delinquencies_last_2y"],
         "utilization_rate": customer["utilization_rate"],
         "current_credit_limit": customer["current_credit_limit"],
-    }, indent=2)
+    })
 
 
 @mcp.tool()
-def get_account_balances(customer_id: str) -> str:
+async def get_account_balances(customer_id: str) -> str:
     """Retrieve all account balances for a customer (checking, savings, credit).
 
     Args:
         customer_id: The customer ID (e.g. CUST-1001)
     """
-    accounts = _bank_api("GET", f"/api/customers/{customer_id}/accounts")
-    total_assets = sum(a["balance"] for a in accounts if a["type"] != "credit")
-    total_owed = sum(abs(a["balance"]) for a in accounts if a["type"] == "credit")
-    return json.dumps({
+    accounts, summary = await asyncio.gather(
+        _abank_api("GET", f"/api/customers/{customer_id}/accounts"),
+        _abank_api("GET", f"/api/customers/{customer_id}/balances-summary"),
+    )
+    return _dumps({
         "customer_id": customer_id,
         "accounts": accounts,
-        "total_assets": total_assets,
-        "total_credit_owed": total_owed,
-    }, indent=2)
+        "total_assets": summary["total_assets"],
+        "total_credit_owed": summary["total_credit_owed"],
+    })
 
 
 @mcp.tool()
-def get_recent_transactions(customer_id: str, limit: int = 15) -> str:
+async def get_recent_transactions(customer_id: str, limit: int = 15) -> str:
     """Retrieve recent transactions across all accounts for a customer.
 
     Args:
         customer_id: The customer ID (e.g. CUST-1001)
         limit: Number of transactions to return (default 15)
     """
-    txns = _bank_api("GET", f"/api/customers/{customer_id}/transactions?limit={limit}")
-    return json.dumps({"customer_id": customer_id, "transactions": txns, "count": len(txns)}, indent=2)
+    txns = await _abank_api("GET", f"/api/customers/{customer_id}/transactions?limit={limit}")
+    return _dumps({"customer_id": customer_id, "transactions": txns, "count": len(txns)})
 
 
 @mcp.tool()
-def get_credit_limit_history(customer_id: str) -> str:
+@_cache_str
+async def get_credit_limit_history(customer_id: str) -> str:
     """Retrieve the history of all credit limit changes for a customer.
 
     Args:
         customer_id: The customer ID (e.g. CUST-1001)
     """
-    history = _bank_api("GET", f"/api/customers/{customer_id}/credit-history")
-    customer = _bank_api("GET", f"/api/customers/{customer_id}")
-    return json.dumps({
+    history, customer = await asyncio.gather(
+        _abank_api("GET", f"/api/customers/{customer_id}/credit-history"),
+        _abank_api("GET", f"/api/customers/{customer_id}"),
+    )
+    return _dumps({
         "customer_id": customer_id,
         "current_limit": customer["current_credit_limit"],
         "change_history": history,
         "total_changes": len(history),
-    }, indent=2)
+    })
 
 
 @mcp.tool()
-def transfer_funds(from_account_id: str, to_account_id: str, amount: float, description: str) -> str:
+async def transfer_funds(from_account_id: str, to_account_id: str, amount: float, description: str) -> str:
     """Transfer funds between accounts. Writes to the bank database.
 
     Args:
@@ -123,17 +211,18 @@ def transfer_funds(from_account_id: str, to_account_id: str, amount: float, desc
         amount: Amount to transfer in dollars
         description: Reason for the transfer
     """
-    result = _bank_api("POST", "/api/transfer", {
+    result = await _abank_api("POST", "/api/transfer", {
         "from_account_id": from_account_id,
         "to_account_id": to_account_id,
         "amount": amount,
         "description": description,
     })
-    return json.dumps(result, indent=2)
+    _invalidate()
+    return _dumps(result)
 
 
 @mcp.tool()
-def update_credit_limit(customer_id: str, new_limit: float, reason: str) -> str:
+async def update_credit_limit(customer_id: str, new_limit: float, reason: str) -> str:
     """Apply a credit limit change for a customer. Writes to the bank database.
     Only call this after the request has been assessed and approved.
 
@@ -142,16 +231,17 @@ def update_credit_limit(customer_id: str, new_limit: float, reason: str) -> str:
         new_limit: The new credit limit amount in dollars
         reason: The reason for the credit limit change
     """
-    result = _bank_api("POST", f"/api/customers/{customer_id}/credit-limit", {
+    result = await _abank_api("POST", f"/api/customers/{customer_id}/credit-limit", {
         "new_limit": new_limit,
         "reason": reason,
         "assessed_by": "bank-credit-limit-agent",
     })
-    return json.dumps(result, indent=2)
+    _invalidate()
+    return _dumps(result)
 
 
 @mcp.tool()
-def create_credit_limit_approval(
+async def create_credit_limit_approval(
     customer_id: str, requested_limit: float, reason: str, risk_summary: str
 ) -> str:
     """Create a pending credit limit approval for admin review.
@@ -163,40 +253,43 @@ def create_credit_limit_approval(
         reason: Why the customer is requesting an increase
         risk_summary: Summary of risk factors from the assessment
     """
-    customer = _bank_api("GET", f"/api/customers/{customer_id}")
-    result = _bank_api("POST", f"/api/customers/{customer_id}/credit-limit-approval", {
+    result = await _abank_api("POST", f"/api/customers/{customer_id}/credit-limit-approval", {
         "requested_new_limit": requested_limit,
-        "current_limit": customer["current_credit_limit"],
         "reason": reason,
         "assessment_summary": risk_summary,
     })
-    return json.dumps(result, indent=2)
+    _invalidate()
+    return _dumps(result)
 
 
 @mcp.tool()
-def list_pending_approvals() -> str:
-    """List all pending approvals across all customers (for admin review)."""
-    result = _bank_api("GET", "/api/approvals")
-    return json.dumps(result, indent=2)
+async def list_pending_approvals() -> str:
+    """List all pending approvals across all customers (for admin review).
+
+    Each approval includes the customer's name, email, credit score and current limit.
+    """
+    result = await _abank_api("GET", "/api/approvals")
+    return _dumps(result)
 
 
 @mcp.tool()
-def resolve_approval(approval_id: int, action: str) -> str:
+async def resolve_approval(approval_id: int, action: str) -> str:
     """Approve or deny a pending approval.
 
     Args:
         approval_id: The approval ID
         action: Either "approve" or "deny"
     """
-    result = _bank_api("POST", f"/api/approvals/{approval_id}", {"action": action})
-    return json.dumps(result, indent=2)
+    result = await _abank_api("POST", f"/api/approvals/{approval_id}", {"action": action})
+    _invalidate()
+    return _dumps(result)
 
 
 @mcp.tool()
-def list_customers() -> str:
+@_cache_str
+async def list_customers() -> str:
     """List all bank customers."""
-    customers = _bank_api("GET", "/api/customers")
-    return json.dumps(customers, indent=2)
+    return _dumps(await _customers())
 
 
 if __name__ == "__main__":
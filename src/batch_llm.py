@@ -0,0 +1,137 @@
+"""ChatOpenAI variant that routes generations through the OpenAI Batch API.
+
+Batch requests are billed at half price but complete asynchronously (minutes to
+hours), so this is only for offline/bulk runs such as graph.run_batch() — never
+for interactive chat. Concurrent async calls share one job; a blocking
+invoke() submits a job of its own.
+"""
+
+import asyncio
+import time
+from typing import Any
+
+import orjson
+from langchain_core.outputs import ChatResult
+from langchain_openai import ChatOpenAI
+from pydantic import PrivateAttr
+
+_ENDPOINT = "/v1/chat/completions"
+_DONE = ("completed", "failed", "expired", "cancelled")
+
+
+class BatchChatOpenAI(ChatOpenAI):
+    """Collects concurrent generations into one Batch API job and polls for results.
+
+    Calls arriving within ``batch_window`` seconds of the first pending call are
+    submitted together; the job is polled every ``poll_interval`` seconds.
+    """
+
+    batch_window: float = 2.0
+    poll_interval: float = 30.0
+    # Streaming would bypass the batch and hit the realtime endpoint at full price
+    disable_streaming: bool = True
+
+    # Pending calls per event loop: the instance is shared (create_graph_batch is
+    # cached), but futures and tasks belong to the loop that created them.
+    _pending: dict[asyncio.AbstractEventLoop, list[tuple[dict, asyncio.Future]]] = PrivateAttr(
+        default_factory=dict,
+    )
+    _flushers: dict[asyncio.AbstractEventLoop, asyncio.Task] = PrivateAttr(default_factory=dict)
+
+    def _generate(self, messages, stop=None, run_manager=None, **kwargs: Any) -> ChatResult:
+        # Blocking callers have nothing to batch with: submit a one-request job and wait
+        results = self._submit_sync([self._batch_body(messages, stop, **kwargs)])
+        return self._create_chat_result(_response_body(0, results))
+
+    async def _agenerate(self, messages, stop=None, run_manager=None, **kwargs: Any) -> ChatResult:
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._pending.setdefault(loop, []).append((self._batch_body(messages, stop, **kwargs), future))
+        if loop not in self._flushers:
+            self._flushers[loop] = asyncio.create_task(self._flush(loop))
+        return self._create_chat_result(await future)
+
+    def _batch_body(self, messages, stop, **kwargs: Any) -> dict:
+        body = self._get_request_payload(messages, stop=stop, **kwargs)
+        body.pop("stream", None)
+        # The SDK merges extra_body into the request; a batch line is the request itself
+        body.update(body.pop("extra_body", None) or {})
+        return body
+
+    def _take_pending(self, loop: asyncio.AbstractEventLoop) -> list[tuple[dict, asyncio.Future]]:
+        """Claim the loop's pending calls; calls arriving afterwards start a new job."""
+        self._flushers.pop(loop, None)
+        return self._pending.pop(loop, [])
+
+    async def _flush(self, loop: asyncio.AbstractEventLoop) -> None:
+        pending: list[tuple[dict, asyncio.Future]] = []
+        try:
+            await asyncio.sleep(self.batch_window)
+            pending = self._take_pending(loop)
+            results = await self._submit([body for body, _ in pending])
+            for i, (_, future) in enumerate(pending):
+                if future.done():
+                    continue
+                try:
+                    future.set_result(_response_body(i, results))
+                except RuntimeError as e:
+                    future.set_exception(e)
+        except Exception as e:
+            for _, future in pending:
+                if not future.done():
+                    future.set_exception(e)
+        finally:
+            # Cancelled (or any other BaseException): never leave a caller waiting
+            for _, future in pending or self._take_pending(loop):
+                future.cancel()
+
+    async def _submit(self, bodies: list[dict]) -> dict[str, dict]:
+        """Upload a JSONL job, wait for it to finish, and return responses by custom_id."""
+        client = self.root_async_client
+        upload = await client.files.create(file=("batch.jsonl", _jsonl(bodies)), purpose="batch")
+        batch = await client.batches.create(
+            input_file_id=upload.id, endpoint=_ENDPOINT, completion_window="24h",
+        )
+        while batch.status not in _DONE:
+            await asyncio.sleep(self.poll_interval)
+            batch = await client.batches.retrieve(batch.id)
+        _check_batch(batch)
+        return _parse_results((await client.files.content(batch.output_file_id)).content)
+
+    def _submit_sync(self, bodies: list[dict]) -> dict[str, dict]:
+        """Blocking twin of _submit."""
+        client = self.root_client
+        upload = client.files.create(file=("batch.jsonl", _jsonl(bodies)), purpose="batch")
+        batch = client.batches.create(input_file_id=upload.id, endpoint=_ENDPOINT, completion_window="24h")
+        while batch.status not in _DONE:
+            time.sleep(self.poll_interval)
+            batch = client.batches.retrieve(batch.id)
+        _check_batch(batch)
+        return _parse_results(client.files.content(batch.output_file_id).content)
+
+
+def _jsonl(bodies: list[dict]) -> bytes:
+    return b"\n".join(
+        orjson.dumps({"custom_id": str(i), "method": "POST", "url": _ENDPOINT, "body": body})
+        for i, body in enumerate(bodies)
+    )
+
+
+def _check_batch(batch) -> None:
+    if batch.status != "completed" or not batch.output_file_id:
+        raise RuntimeError(f"OpenAI batch {batch.id} ended with status {batch.status}")
+
+
+def _parse_results(content: bytes) -> dict[str, dict]:
+    results = {}
+    for line in content.splitlines():
+        record = orjson.loads(line)
+        results[record["custom_id"]] = record["response"]
+    return results
+
+
+def _response_body(i: int, results: dict[str, dict]) -> dict:
+    response = results.get(str(i))
+    if response and response["status_code"] == 200:
+        return response["body"]
+    raise RuntimeError(f"Batch request {i} failed: {response}")
@@ -7,6 +7,9 @@ LLM_BASE_URL = os.environ.get(
 )
 LLM_MODEL = os.environ.get("LLM_MODEL", "gpt-4o-mini-2024-07-18")
 OPENAI_API_KEY = os.environ.get("OPENAI_API_KEY", "")
+# Sent as OpenAI's prompt_cache_key so requests sharing the system prompt and
+# tool schemas land on the same prefix cache.
+PROMPT_CACHE_KEY = os.environ.get("PROMPT_CACHE_KEY", "bank-credit-limit-agent")
 
 # kagent A2A Configuration
 KAGENT_CONTROLLER_URL = os.environ.get(
@@ -19,9 +22,22 @@ AGENT_NAMESPACE = os.environ.get("AGENT_NAMESPACE", "kagent")
 AGENT_NAME = "bank-credit-limit-agent"
 CREDIT_ASSESSMENT_AGENT = "credit-assessment-agent"
 SERVER_PORT = int(os.environ.get("PORT", "8080"))
+# Upper bound on conversations run_batch() drives at once; keep it within the
+# LLM provider's concurrent-request quota.
+BATCH_MAX_CONCURRENCY = int(os.environ.get("BATCH_MAX_CONCURRENCY", "10"))
+# Route run_batch() LLM calls through the OpenAI Batch API (half price, slow).
+# The Batch API is OpenAI-only, so it talks to OpenAI directly, not the gateway.
+BATCH_MODE = os.environ.get("BATCH_MODE", "false").lower() in ("1", "true")
+OPENAI_BATCH_BASE_URL = os.environ.get("OPENAI_BATCH_BASE_URL", "https://api.openai.com/v1")
 
 # Bank Web Backend API (source of truth for all banking data)
 BANK_API_URL = os.environ.get(
     "BANK_API_URL",
     "http://solo-bank-web.kagent.svc.cluster.local:8080",
 )
+
+# HTTP/2 for the bank backend and the kagent controller, so concurrent tool
+# calls and assessments multiplex over one connection. httpx only upgrades over
+# TLS (ALPN); plain http:// URLs stay on HTTP/1.1 either way.
+BANK_API_HTTP2 = os.environ.get("BANK_API_HTTP2", "true").lower() in ("1", "true")
+KAGENT_A2A_HTTP2 = os.environ.get("KAGENT_A2A_HTTP2", "true").lower() in ("1", "true")
@@ -7,6 +7,7 @@ to /data/bank.db (or in-memory if the path isn't writable).
 import json
 import os
 import sqlite3
+import threading
 from datetime import datetime, timezone
 from contextlib import contextmanager
 
@@ -29,21 +30,65 @@ def _get_db_path() -> str:
 _DB = _get_db_path()
 
 
-@contextmanager
-def get_db():
-    conn = sqlite3.connect(_DB)
+def _connect() -> sqlite3.Connection:
+    conn = sqlite3.connect(_DB, check_same_thread=False, isolation_level=None)
     conn.row_factory = sqlite3.Row
-    conn.execute("PRAGMA journal_mode=WAL")
-    try:
-        yield conn
-        conn.commit()
-    finally:
-        conn.close()
+    conn.executescript("""
+        PRAGMA journal_mode=WAL;
+        PRAGMA synchronous=NORMAL;
+        PRAGMA temp_store=MEMORY;
+        PRAGMA mmap_size=268435456;
+        PRAGMA cache_size=-20000;
+    """)
+    return conn
+
+
+# One connection for the life of the process: keeps SQLite's page cache warm
+# and skips the open/PRAGMA cost on every query. The lock serializes access
+# since the connection is shared across threads. Opened lazily by init_db()
+# so importing this module does no I/O.
+_CONN: sqlite3.Connection | None = None
+_LOCK = threading.RLock()
+_INITIALIZED = False
+
+
+@contextmanager
+def _session(write: bool = False):
+    with _LOCK:
+        if not write:
+            yield _CONN
+            return
+        _CONN.execute("BEGIN")
+        try:
+            yield _CONN
+        except BaseException:
+            _CONN.execute("ROLLBACK")
+            raise
+        _CONN.execute("COMMIT")
+
+
+def get_db(write: bool = False):
+    """Yield the shared connection. Writers get an explicit transaction."""
+    init_db()
+    return _session(write)
 
 
 def init_db():
+    """Open the database and create/seed tables on first use; later calls are no-ops."""
+    global _CONN, _INITIALIZED
+    if _INITIALIZED:
+        return
+    with _LOCK:
+        if _INITIALIZED:
+            return
+        _CONN = _connect()
+        _create_schema()
+        _INITIALIZED = True
+
+
+def _create_schema():
     """Create tables and seed demo data if not already present."""
-    with get_db() as conn:
+    with _session() as conn:
         conn.executescript("""
             CREATE TABLE IF NOT EXISTS customers (
                 id TEXT PRIMARY KEY,
@@ -96,13 +141,27 @@ def init_db():
                 status TEXT,
                 assessed_by TEXT DEFAULT 'credit-assessment-agent'
             );
+
+            CREATE INDEX IF NOT EXISTS idx_txn_cust_ts ON transactions(customer_id, timestamp DESC);
+            CREATE INDEX IF NOT EXISTS idx_pay_cust_month ON payment_history(customer_id, month DESC);
+            CREATE INDEX IF NOT EXISTS idx_clc_cust_ts ON credit_limit_changes(customer_id, timestamp DESC);
+
+            -- Every applied limit change is mirrored into the transaction log
+            -- by SQLite itself, so writers issue one INSERT instead of two.
+            CREATE TRIGGER IF NOT EXISTS trg_credit_limit_change_txn
+            AFTER INSERT ON credit_limit_changes WHEN NEW.status = 'APPLIED'
+            BEGIN
+                INSERT INTO transactions (customer_id, timestamp, type, description, amount, balance_after)
+                VALUES (NEW.customer_id, NEW.timestamp, 'CREDIT_LIMIT_CHANGE',
+                        'Credit limit increased: ' || NEW.reason, 0, NEW.new_limit);
+            END;
         """)
 
         # Seed if empty
-        existing = conn.execute("SELECT COUNT(*) FROM customers").fetchone()[0]
-        if existing > 0:
+        if conn.execute("SELECT 1 FROM customers LIMIT 1").fetchone():
             return
 
+    with _session(write=True) as conn:
         # --- Seed customers ---
         _seed_data = [
             ("CUST-1001", "Alice Johnson", "alice.johnson@example.com", 780, 10000.00, 48, 95000.00, 1200.00, 0.35, 1, 0),
@@ -184,6 +243,9 @@ def init_db():
             _payments,
         )
 
+        # Give the planner real statistics for the new indexes
+        conn.execute("ANALYZE")
+
 
 # ---------------------------------------------------------------------------
 # Query helpers (used by tools)
@@ -197,7 +259,7 @@ def get_customer(customer_id: str) -> dict | None:
 
 def get_all_customer_ids() -> list[str]:
     with get_db() as conn:
-        return [r[0] for r in conn.execute("SELECT id FROM customers").fetchall()]
+        return [r[0] for r in conn.execute("SELECT id FROM customers")]
 
 
 def get_balances(customer_id: str) -> dict | None:
@@ -208,48 +270,43 @@ def get_balances(customer_id: str) -> dict | None:
 
 def get_transactions(customer_id: str, limit: int = 10) -> list[dict]:
     with get_db() as conn:
-        rows = conn.execute(
+        cur = conn.execute(
             "SELECT * FROM transactions WHERE customer_id = ? ORDER BY timestamp DESC LIMIT ?",
             (customer_id, limit),
-        ).fetchall()
-        return [dict(r) for r in rows]
+        )
+        return [dict(r) for r in cur]
 
 
 def get_payment_history_rows(customer_id: str) -> list[dict]:
     with get_db() as conn:
-        rows = conn.execute(
+        cur = conn.execute(
             "SELECT * FROM payment_history WHERE customer_id = ? ORDER BY month DESC",
             (customer_id,),
-        ).fetchall()
-        return [dict(r) for r in rows]
+        )
+        return [dict(r) for r in cur]
+
+
+_SQL_UPDATE_LIMIT = "UPDATE customers SET current_credit_limit = ? WHERE id = ?"
+_SQL_INSERT_CHANGE = (
+    "INSERT INTO credit_limit_changes (customer_id, timestamp, old_limit, new_limit, reason, status) "
+    "VALUES (?,?,?,?,?,?)"
+)
 
 
 def update_credit_limit_db(customer_id: str, old_limit: float, new_limit: float, reason: str) -> dict:
     now = datetime.now(timezone.utc).isoformat()
-    with get_db() as conn:
-        conn.execute(
-            "UPDATE customers SET current_credit_limit = ? WHERE id = ?",
-            (new_limit, customer_id),
-        )
-        conn.execute(
-            "INSERT INTO credit_limit_changes (customer_id, timestamp, old_limit, new_limit, reason, status) VALUES (?,?,?,?,?,?)",
-            (customer_id, now, old_limit, new_limit, reason, "APPLIED"),
-        )
-        conn.execute(
-            "INSERT INTO transactions (customer_id, timestamp, type, description, amount, balance_after) VALUES (?,?,?,?,?,?)",
-            (customer_id, now, "CREDIT_LIMIT_CHANGE", f"Credit limit increased: {reason}", 0, new_limit),
-        )
+    with get_db(write=True) as conn:
+        conn.execute(_SQL_UPDATE_LIMIT, (new_limit, customer_id))
+        # trg_credit_limit_change_txn records the matching transaction row
+        conn.execute(_SQL_INSERT_CHANGE, (customer_id, now, old_limit, new_limit, reason, "APPLIED"))
     return {"timestamp": now, "old_limit": old_limit, "new_limit": new_limit}
 
 
 def get_credit_limit_history(customer_id: str) -> list[dict]:
     with get_db() as conn:
-        rows = conn.execute(
+        cur = conn.execute(
             "SELECT * FROM credit_limit_changes WHERE customer_id = ? ORDER BY timestamp DESC",
             (customer_id,),
-        ).fetchall()
-        return [dict(r) for r in rows]
-
+        )
+        return [dict(r) for r in cur]
 
-# Initialize on import
-init_db()
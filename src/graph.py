@@ -1,93 +1,114 @@
 """LangGraph agent definition for the Bank Credit Limit Agent."""
 
+import functools
+import uuid
+
 from langchain_openai import ChatOpenAI
 from langgraph.prebuilt import create_react_agent
 
-from config import LLM_BASE_URL, LLM_MODEL, OPENAI_API_KEY
-from tools import banking_tools
-
+from batch_llm import BatchChatOpenAI
+from config import (
+    BATCH_MAX_CONCURRENCY,
+    BATCH_MODE,
+    LLM_BASE_URL,
+    LLM_MODEL,
+    OPENAI_API_KEY,
+    OPENAI_BATCH_BASE_URL,
+    PROMPT_CACHE_KEY,
+)
+
+# Keep this byte-identical across requests (no timestamps or per-user text):
+# together with the tool schemas it forms the prefix the provider caches.
 SYSTEM_PROMPT = """\
-You are the **Bank Credit Limit Agent**, a professional banking assistant that \
-handles credit limit increase requests.
-
-## Your Role
-You help customers request credit limit increases on their accounts. You gather \
-customer data, request a risk assessment from the Credit Assessment Agent (A2A), \
-and then either auto-approve or route to manual admin review based on strict rules.
-
-## Available Customers (for demo)
-- CUST-1001: Alice Johnson
-- CUST-1002: Bob Martinez
-- CUST-1003: Carol Chen
-- CUST-1004: David Park
-
-## Available Tools
-- `get_customer_profile` — customer name, income, account details
-- `get_credit_score` — credit score and credit metrics
-- `get_payment_history` — on-time vs late payment records
-- `get_account_balances` — checking, savings, and credit balances
-- `get_recent_transactions` — recent deposits, purchases, payments, withdrawals
-- `get_credit_limit_change_history` — past credit limit changes
-- `request_credit_assessment` — A2A call to Credit Assessment Agent for risk eval
-- `update_credit_limit` — apply approved credit limit change (writes to database)
-- `create_credit_limit_approval` — create pending approval for admin manual review
-
-## Workflow for Credit Limit Increase Requests
-
-1. **Identify the customer** — ask for or confirm the customer ID
-2. **Retrieve customer profile** — use `get_customer_profile`
-3. **Check account balances** — use `get_account_balances`
-4. **Check credit score** — use `get_credit_score`
-5. **Review payment history** — use `get_payment_history`
-6. **Review recent transactions** — use `get_recent_transactions`
-7. **Request assessment** — use `request_credit_assessment` to send all data to \
-the Credit Assessment Agent for a risk evaluation (AGENT-TO-AGENT call)
-8. **Apply decision rules** based on customer data AND the assessment:
-
-   **AUTO-APPROVE** (call `update_credit_limit` directly) if ALL of these are true:
-   - Credit score >= 740
-   - Debt-to-Income ratio < 36%
-   - Zero delinquencies in last 2 years
-   - Credit Assessment Agent recommendation is APPROVE
-   - Requested increase is <= 2x current limit
-
-   **MANUAL REVIEW** (call `create_credit_limit_approval`) if ANY of these are true:
-   - Credit score < 740
-   - DTI >= 36%
-   - Any delinquencies in last 2 years
-   - Assessment recommendation is CONDITIONAL_APPROVE or DENY
-   - Requested increase > 2x current limit
-
-9. **Report the outcome**:
-   - If auto-approved: confirm the new limit and verify with `get_credit_limit_change_history`
-   - If sent to manual review: tell the customer their request is pending admin approval
+You are the Bank Credit Limit Agent, a professional banking assistant that \
+handles credit limit increase requests. Tool descriptions are provided separately.
+Demo customers: CUST-1001 Alice Johnson, CUST-1002 Bob Martinez, CUST-1003 Carol Chen, \
+CUST-1004 David Park.
+
+## Workflow
+1. Confirm the customer ID.
+2. Gather data with `get_customer_bundle`; use the narrower tools only for follow-ups.
+3. ALWAYS call `request_credit_assessment` (A2A) before any decision.
+4. AUTO-APPROVE with `update_credit_limit` only if ALL hold: credit score >= 740, \
+DTI < 36%, zero delinquencies in 2 years, assessment is APPROVE, and the \
+increase is <= 2x the current limit.
+5. Otherwise create a MANUAL REVIEW with `create_credit_limit_approval`, listing \
+ALL risk factors.
+6. Report the outcome: the new limit if approved, or that the request is \
+pending admin approval.
 
 ## Rules
-- NEVER skip the credit assessment step — always call `request_credit_assessment` \
-before making any decision
-- NEVER auto-approve a request that fails ANY of the auto-approve criteria
-- When creating a manual review request, include ALL risk factors in the description
-- Be professional and empathetic, especially when routing to manual review
-- Clearly explain the reasoning behind decisions
-- Maximum increase is 3x the current limit (reject requests above this)
-- All changes are persisted to the database and can be audited
-- All LLM calls are proxied through the Bank AgentGateway for observability
+- Reject increases above 3x the current limit.
+- Be professional and empathetic, and explain the reasoning behind decisions.
 """
 
 
-def create_graph():
-    """Create and return the compiled LangGraph for the bank credit limit agent."""
+def _start_turn(state: dict) -> dict:
+    """Pre-model hook: a trailing user message means a new turn has begun."""
+    from tools import reset_turn_cache
+
+    messages = state["messages"]
+    if messages and messages[-1].type == "human":
+        reset_turn_cache()
+    return {"llm_input_messages": messages}
+
+
+@functools.lru_cache(maxsize=None)
+def create_graph(model: str = LLM_MODEL, base_url: str = LLM_BASE_URL):
+    """Create and return the compiled LangGraph for the bank credit limit agent.
+
+    Compiled once per (model, base_url) and reused on later calls.
+    """
+    # Stream tokens so the A2A executor can forward the answer as it decodes
     llm = ChatOpenAI(
-        model=LLM_MODEL,
-        base_url=LLM_BASE_URL,
+        model=model,
+        base_url=base_url,
         api_key=OPENAI_API_KEY,
         temperature=0.1,
+        streaming=True,
+        extra_body={"prompt_cache_key": PROMPT_CACHE_KEY},
     )
 
-    graph = create_react_agent(
+    return _build_agent(llm)
+
+
+@functools.lru_cache(maxsize=None)
+def create_graph_batch(model: str = LLM_MODEL, base_url: str = OPENAI_BATCH_BASE_URL):
+    """Same agent, but LLM calls go through the OpenAI Batch API (offline use only)."""
+    llm = BatchChatOpenAI(
+        model=model,
+        base_url=base_url,
+        api_key=OPENAI_API_KEY,
+        temperature=0.1,
+        extra_body={"prompt_cache_key": PROMPT_CACHE_KEY},
+    )
+    return _build_agent(llm)
+
+
+def _build_agent(llm):
+    # Deferred so importing this module (e.g. for SYSTEM_PROMPT or run_batch)
+    # doesn't load the tool stack and open its HTTP clients.
+    from tools import banking_tools
+
+    return create_react_agent(
         model=llm,
         tools=banking_tools,
         prompt=SYSTEM_PROMPT,
+        pre_model_hook=_start_turn,
     )
 
-    return graph
+
+async def run_batch(inputs: list[dict], max_concurrency: int = BATCH_MAX_CONCURRENCY) -> list[dict]:
+    """Run independent requests (e.g. one per customer) through the agent concurrently.
+
+    Each input is a graph input such as ``{"messages": [("user", "...")]}``.
+    Every run gets its own thread_id so per-turn tool caches stay separate;
+    ``max_concurrency`` caps how many runs (and so LLM calls) are in flight.
+    With BATCH_MODE set, the runs' LLM calls are pooled into OpenAI Batch jobs.
+    """
+    graph = create_graph_batch() if BATCH_MODE else create_graph()
+    configs = [
+        {"configurable": {"thread_id": f"batch-{uuid.uuid4().hex}"}, "max_concurrency": max_concurrency}
+        for _ in inputs
+    ]
+    return await graph.abatch(inputs, config=configs)
@@ -1,30 +1,331 @@
 """Banking tools — all calls go to the Solo Bank Web Backend API (single source of truth)."""
 
+import asyncio
+import atexit
+import functools
+import inspect
+import itertools
 import json
+import re
+import time
 import uuid
+from typing import Any
 import httpx
+import orjson
+from langchain_core.runnables import ensure_config
 from langchain_core.tools import tool
+from pydantic import BaseModel, Field
 
 from config import (
     KAGENT_CONTROLLER_URL,
     AGENT_NAMESPACE,
     CREDIT_ASSESSMENT_AGENT,
     BANK_API_URL,
+    BANK_API_HTTP2,
+    KAGENT_A2A_HTTP2,
 )
 
 
+# Long-lived async client for A2A calls so keep-alive (and HTTP/2 where the
+# controller offers it) amortize handshakes across assessments, and several
+# assessments can be in flight at once.
+_A2A_ASYNC = httpx.AsyncClient(
+    http2=KAGENT_A2A_HTTP2,
+    timeout=httpx.Timeout(connect=5.0, read=60.0, write=10.0, pool=5.0),
+    limits=httpx.Limits(max_keepalive_connections=20, max_connections=100),
+    headers={"Content-Type": "application/json"},
+)
+_A2A_URL = f"{KAGENT_CONTROLLER_URL}/api/a2a/{AGENT_NAMESPACE}/{CREDIT_ASSESSMENT_AGENT}/"
+# JSON-RPC tasks/send request with the static parts pre-encoded; fill with
+# (task id, orjson-encoded prompt text, request id).
+_A2A_TASK_SEND = (
+    b'{"jsonrpc":"2.0","method":"tasks/send","params":{"id":"%b","message":'
+    b'{"role":"user","parts":[{"type":"text","text":%b}]}},"id":"%b"}'
+)
+
+
+# Bank API paths, bound once as str.format methods.
+_P_CUSTOMERS = "/api/customers"
+_P_CUSTOMER = "/api/customers/{}".format
+_P_ACCOUNTS = "/api/customers/{}/accounts".format
+_P_TXNS = "/api/customers/{}/transactions?limit={}".format
+_P_PAYMENT_SUMMARY = "/api/customers/{}/payment-summary".format
+_P_CREDIT_HISTORY = "/api/customers/{}/credit-history".format
+_P_BUNDLE_FIELDS = "/api/customers/{}/bundle?fields={}".format
+_P_BUNDLE_LIMIT = "/api/customers/{}/bundle?limit={}".format
+_P_CREDIT_LIMIT = "/api/customers/{}/credit-limit".format
+_P_CREDIT_LIMIT_APPROVAL = "/api/customers/{}/credit-limit-approval".format
+_P_TRANSFER = "/api/transfer"
+
+# Pooled client for the bank backend: tools make several calls per turn, so
+# keep-alive connections are reused instead of reconnecting on every call.
+_BANK_CLIENT = httpx.Client(
+    base_url=BANK_API_URL,
+    timeout=15.0,
+    http2=BANK_API_HTTP2,
+    limits=httpx.Limits(max_keepalive_connections=20, max_connections=50, keepalive_expiry=60),
+)
+atexit.register(_BANK_CLIENT.close)
+
+# Async twin for tools that fan out independent GETs with asyncio.gather
+_BANK_ASYNC = httpx.AsyncClient(
+    base_url=BANK_API_URL,
+    timeout=15.0,
+    http2=BANK_API_HTTP2,
+    limits=httpx.Limits(max_keepalive_connections=20, max_connections=50, keepalive_expiry=60),
+)
+
+
+# Recently fetched GET responses, keyed by path. TTLs follow how often each
+# resource family changes; anything not listed is always fetched fresh.
+_GET_TTLS = {"customers": 30.0, "accounts": 15.0, "credit-history": 60.0}
+_GET_CACHE: dict[str, tuple[float, str | None, Any]] = {}
+_MISS = object()
+
+
+def _get_ttl(path: str) -> float | None:
+    parts = path.split("?")[0].strip("/").split("/")
+    if parts[:2] != ["api", "customers"]:
+        return None
+    return _GET_TTLS.get(parts[3] if len(parts) > 3 else "customers")
+
+
+def _cache_get(path: str) -> tuple[Any, dict | None]:
+    """Return (fresh value or _MISS, If-None-Match headers for revalidating a stale entry)."""
+    hit = _GET_CACHE.get(path)
+    if not hit:
+        return _MISS, None
+    expires, etag, value = hit
+    if expires > time.monotonic():
+        return value, None
+    return _MISS, {"If-None-Match": etag} if etag else None
+
+
+def _cache_put(path: str, resp: httpx.Response) -> Any:
+    """Decode a GET response and cache it; a 304 keeps the cached body and restarts its TTL."""
+    hit = _GET_CACHE.get(path)
+    if resp.status_code == 304 and hit:
+        _, etag, value = hit
+    else:
+        resp.raise_for_status()
+        etag, value = resp.headers.get("ETag"), orjson.loads(resp.content)
+    ttl = _get_ttl(path)
+    if ttl:
+        _GET_CACHE[path] = (time.monotonic() + ttl, etag, value)
+    return value
+
+
+def _invalidate(path: str) -> None:
+    """Drop cached GETs a POST may have changed: the customer's keys, or everything."""
+    parts = path.strip("/").split("/")
+    if parts[:2] != ["api", "customers"] or len(parts) < 3:
+        _GET_CACHE.clear()
+        return
+    prefix = _P_CUSTOMER(parts[2])
+    for key in [k for k in list(_GET_CACHE) if k == prefix or k.startswith(prefix + "/")]:
+        _GET_CACHE.pop(key, None)
+
+
 def _bank_api(method: str, path: str, body: dict | None = None) -> dict | list:
     """Call the Solo Bank Web Backend API."""
-    with httpx.Client(base_url=BANK_API_URL, timeout=15.0) as client:
-        if method == "GET":
-            resp = client.get(path)
+    if method == "GET":
+        cached, headers = _cache_get(path)
+        if cached is not _MISS:
+            return cached
+        return _cache_put(path, _BANK_CLIENT.get(path, headers=headers))
+    resp = _BANK_CLIENT.post(path, json=body)
+    resp.raise_for_status()
+    _invalidate(path)
+    return orjson.loads(resp.content)
+
+
+async def _bank_api_async(method: str, path: str, body: dict | None = None) -> dict | list:
+    """Async variant of _bank_api."""
+    if method == "GET":
+        cached, headers = _cache_get(path)
+        if cached is not _MISS:
+            return cached
+        return _cache_put(path, await _BANK_ASYNC.get(path, headers=headers))
+    resp = await _BANK_ASYNC.post(path, json=body)
+    resp.raise_for_status()
+    _invalidate(path)
+    return orjson.loads(resp.content)
+
+
+def _bank_api_raw(path: str) -> httpx.Response:
+    """GET without decoding, for bodies that are passed through to the LLM as-is."""
+    resp = _BANK_CLIENT.get(path)
+    resp.raise_for_status()
+    return resp
+
+
+def _dumps(obj) -> str:
+    """Compact JSON for tool results; indentation only costs the LLM tokens."""
+    return orjson.dumps(obj).decode()
+
+
+def _account_totals(accounts: list[dict]) -> tuple[float, float]:
+    """(total assets, total credit owed) in one pass over the accounts."""
+    assets = owed = 0.0
+    for a in accounts:
+        balance = a["balance"]
+        if a["type"] == "credit":
+            owed += abs(balance)
         else:
-            resp = client.post(path, json=body)
-        resp.raise_for_status()
-        return resp.json()
+            assets += balance
+    return assets, owed
+
+
+@functools.lru_cache(maxsize=1)
+def _ids_hint() -> str:
+    """Valid customer IDs (with names) for "not found" replies; the roster is fixed at runtime."""
+    return "Valid IDs: " + ", ".join(f"{c['id']} ({c['name']})" for c in _bank_api("GET", _P_CUSTOMERS))
+
+
+async def _ids_hint_async() -> str:
+    """_ids_hint for coroutines: the first, uncached fetch runs off the event loop."""
+    if _ids_hint.cache_info().currsize:
+        return _ids_hint()
+    return await asyncio.to_thread(_ids_hint)
+
+
+_CID_RE = re.compile(r"CUST-[0-9]{4}")
+
+
+def _require_customer_id(fn):
+    """Answer malformed customer IDs with the valid list instead of calling the backend."""
+    def invalid(args, kwargs) -> str | None:
+        customer_id = kwargs["customer_id"] if "customer_id" in kwargs else args[0]
+        return None if _CID_RE.fullmatch(customer_id) else f"Invalid customer ID format: {customer_id!r}."
+
+    if inspect.iscoroutinefunction(fn):
+        @functools.wraps(fn)
+        async def async_wrapper(*args, **kwargs):
+            if error := invalid(args, kwargs):
+                return f"{error} {await _ids_hint_async()}"
+            return await fn(*args, **kwargs)
+        return async_wrapper
+
+    @functools.wraps(fn)
+    def wrapper(*args, **kwargs):
+        if error := invalid(args, kwargs):
+            return f"{error} {_ids_hint()}"
+        return fn(*args, **kwargs)
+    return wrapper
+
+
+# Read-only tool results memoized for the current agent turn, keyed by the
+# conversation's thread_id (read from LangChain's context-local run config).
+# The graph's pre-model hook calls reset_turn_cache() when a new user message
+# arrives, so a result is only reused within the turn that produced it. Calls
+# made without a thread_id are never memoized.
+_TURN_CACHE: dict[str, dict[tuple[str, str], str]] = {}
+_TURN_CACHE_MAX_THREADS = 256
+
+
+def _thread_id() -> str | None:
+    thread_id = ensure_config().get("configurable", {}).get("thread_id")
+    return None if thread_id is None else str(thread_id)
+
+
+def reset_turn_cache() -> None:
+    _TURN_CACHE.pop(_thread_id(), None)
 
 
-@tool
+def _forget_customer(customer_id: str) -> None:
+    """Drop this turn's cached reads for a customer after a write."""
+    cache = _TURN_CACHE.get(_thread_id())
+    if cache:
+        needle = json.dumps(customer_id)
+        # Snapshot: parallel tool calls may be inserting into this dict
+        for key in [k for k in list(cache) if needle in k[1]]:
+            cache.pop(key, None)
+
+
+def _turn_cache() -> dict[tuple[str, str], str] | None:
+    thread_id = _thread_id()
+    if thread_id is None:
+        return None
+    cache = _TURN_CACHE.get(thread_id)
+    if cache is None:
+        while len(_TURN_CACHE) >= _TURN_CACHE_MAX_THREADS:
+            _TURN_CACHE.pop(next(iter(_TURN_CACHE)))
+        cache = _TURN_CACHE[thread_id] = {}
+    return cache
+
+
+def _memoize_turn(fn):
+    def cache_key(args, kwargs) -> tuple[str, str]:
+        return (fn.__name__, json.dumps([args, kwargs], sort_keys=True))
+
+    if inspect.iscoroutinefunction(fn):
+        @functools.wraps(fn)
+        async def async_wrapper(*args, **kwargs):
+            cache = _turn_cache()
+            if cache is None:
+                return await fn(*args, **kwargs)
+            key = cache_key(args, kwargs)
+            if key not in cache:
+                cache[key] = await fn(*args, **kwargs)
+            return cache[key]
+        return async_wrapper
+
+    @functools.wraps(fn)
+    def wrapper(*args, **kwargs):
+        cache = _turn_cache()
+        if cache is None:
+            return fn(*args, **kwargs)
+        key = cache_key(args, kwargs)
+        if key not in cache:
+            cache[key] = fn(*args, **kwargs)
+        return cache[key]
+    return wrapper
+
+
+# Tool argument schemas, declared up front so @tool doesn't infer one per function.
+_CUSTOMER_ID = Field(description="The customer ID (e.g. CUST-1001)")
+
+
+class _CustomerArgs(BaseModel):
+    customer_id: str = _CUSTOMER_ID
+
+
+class _TransactionsArgs(_CustomerArgs):
+    limit: int = Field(15, description="Number of transactions to return (default 15)")
+
+
+class _TransferArgs(BaseModel):
+    from_account_id: str = Field(description="Source account ID (e.g. ACC-1001-CHK)")
+    to_account_id: str = Field(description="Destination account ID (e.g. ACC-1001-SAV)")
+    amount: float = Field(description="Amount to transfer in dollars")
+    description: str = Field(description="Reason for the transfer")
+
+
+class _UpdateLimitArgs(_CustomerArgs):
+    new_limit: float = Field(description="The new credit limit amount in dollars")
+    reason: str = Field(description="The reason for the credit limit change")
+
+
+class _AssessmentArgs(_CustomerArgs):
+    requested_new_limit: float = Field(description="The new credit limit the customer is requesting")
+
+
+class _BatchAssessmentArgs(BaseModel):
+    customer_ids: list[str] = Field(description="The customer IDs to assess")
+    requested_new_limits: list[float] = Field(
+        description="The requested new limit for each customer, in the same order",
+    )
+
+
+class _ApprovalArgs(_CustomerArgs):
+    requested_limit: float = Field(description="The requested new credit limit amount")
+    reason: str = Field(description="Why the customer is requesting an increase")
+    risk_summary: str = Field(description="Summary of risk factors from the credit assessment")
+
+
+@tool(args_schema=_CustomerArgs)
+@_require_customer_id
+@_memoize_turn
 def get_customer_profile(customer_id: str) -> str:
     """Look up a customer's profile including name, income, credit details, and account info.
 
@@ -32,54 +333,76 @@ def get_customer_profile(customer_id: str) -> str:
         customer_id: The customer ID (e.g. CUST-1001)
     """
     try:
-        customer = _bank_api("GET", f"/api/customers/{customer_id}")
-        accounts = _bank_api("GET", f"/api/customers/{customer_id}/accounts")
-        return json.dumps({"customer": customer, "accounts": accounts}, indent=2)
+        return _dumps(_bank_api("GET", _P_BUNDLE_FIELDS(customer_id, "customer,accounts")))
     except httpx.HTTPStatusError as e:
         if e.response.status_code == 404:
-            customers = _bank_api("GET", "/api/customers")
-            ids = ", ".join(c["id"] for c in customers)
-            return f"Customer {customer_id} not found. Valid IDs: {ids}"
+            return f"Customer {customer_id} not found. {_ids_hint()}"
         raise
 
 
-@tool
+@tool(args_schema=_CustomerArgs)
+@_require_customer_id
+@_memoize_turn
+def get_customer_bundle(customer_id: str) -> str:
+    """Retrieve everything needed to review a customer in one call: profile,
+    credit metrics, account balances, payment history, recent transactions,
+    and credit limit change history.
+
+    Args:
+        customer_id: The customer ID (e.g. CUST-1001)
+    """
+    try:
+        bundle = _bank_api("GET", _P_BUNDLE_LIMIT(customer_id, 15))
+    except httpx.HTTPStatusError as e:
+        if e.response.status_code == 404:
+            return f"Customer {customer_id} not found. {_ids_hint()}"
+        raise
+    bundle["total_assets"], bundle["total_credit_owed"] = _account_totals(bundle["accounts"])
+    return _dumps(bundle)
+
+
+@tool(args_schema=_CustomerArgs)
+@_require_customer_id
+@_memoize_turn
 def get_credit_score(customer_id: str) -> str:
     """Retrieve a customer's credit score and credit history metrics.
 
     Args:
         customer_id: The customer ID (e.g. CUST-1001)
     """
-    customer = _bank_api("GET", f"/api/customers/{customer_id}")
-    return json.dumps({
+    customer = _bank_api("GET", _P_CUSTOMER(customer_id))
+    return _dumps({
         "customer_id": customer["id"],
         "credit_score": customer["credit_score"],
         "recent_inquiries": customer["recent_inquiries"],
         "delinquencies_last_2y": customer["delinquencies_last_2y"],
         "utilization_rate": customer["utilization_rate"],
         "current_credit_limit": customer["current_credit_limit"],
-    }, indent=2)
+    })
 
 
-@tool
+@tool(args_schema=_CustomerArgs)
+@_require_customer_id
+@_memoize_turn
 def get_account_balances(customer_id: str) -> str:
     """Retrieve a customer's account balances (checking, savings, credit).
 
     Args:
         customer_id: The customer ID (e.g. CUST-1001)
     """
-    accounts = _bank_api("GET", f"/api/customers/{customer_id}/accounts")
-    total_assets = sum(a["balance"] for a in accounts if a["type"] != "credit")
-    total_owed = sum(abs(a["balance"]) for a in accounts if a["type"] == "credit")
-    return json.dumps({
+    accounts = _bank_api("GET", _P_ACCOUNTS(customer_id))
+    total_assets, total_owed = _account_totals(accounts)
+    return _dumps({
         "customer_id": customer_id,
         "accounts": accounts,
         "total_assets": total_assets,
         "total_credit_owed": total_owed,
-    }, indent=2)
+    })
 
 
-@tool
+@tool(args_schema=_TransactionsArgs)
+@_require_customer_id
+@_memoize_turn
 def get_recent_transactions(customer_id: str, limit: int = 15) -> str:
     """Retrieve a customer's recent transactions across all accounts.
 
@@ -87,47 +410,59 @@ def get_recent_transactions(customer_id: str, limit: int = 15) -> str:
         customer_id: The customer ID (e.g. CUST-1001)
         limit: Number of transactions to return (default 15)
     """
-    txns = _bank_api("GET", f"/api/customers/{customer_id}/transactions?limit={limit}")
-    return json.dumps({"customer_id": customer_id, "transactions": txns, "count": len(txns)}, indent=2)
+    # Splice the backend's JSON array in verbatim instead of decoding and re-encoding it
+    resp = _bank_api_raw(_P_TXNS(customer_id, limit))
+    count = resp.headers.get("X-Result-Count") or len(orjson.loads(resp.content))
+    return f'{{"customer_id":{_dumps(customer_id)},"count":{count},"transactions":{resp.text}}}'
 
 
-@tool
-def get_payment_history(customer_id: str) -> str:
+@tool(args_schema=_CustomerArgs)
+@_require_customer_id
+@_memoize_turn
+async def get_payment_history(customer_id: str) -> str:
     """Retrieve a customer's credit card payment history (on-time vs late).
 
     Args:
         customer_id: The customer ID (e.g. CUST-1001)
     """
-    # Payment history is part of the customer profile context —
-    # fetched from the web backend's customer endpoint
-    customer = _bank_api("GET", f"/api/customers/{customer_id}")
-    return json.dumps({
+    # On-time counts are aggregated by the backend; no per-row work here
+    customer, summary = await asyncio.gather(
+        _bank_api_async("GET", _P_CUSTOMER(customer_id)),
+        _bank_api_async("GET", _P_PAYMENT_SUMMARY(customer_id)),
+    )
+    return _dumps({
         "customer_id": customer_id,
+        "on_time_payments": summary["on_time"],
+        "total_payments": summary["total"],
         "credit_score": customer["credit_score"],
         "delinquencies_last_2y": customer["delinquencies_last_2y"],
         "account_age_months": customer["account_age_months"],
         "utilization_rate": customer["utilization_rate"],
-    }, indent=2)
+    })
 
 
-@tool
-def get_credit_limit_change_history(customer_id: str) -> str:
+@tool(args_schema=_CustomerArgs)
+@_require_customer_id
+@_memoize_turn
+async def get_credit_limit_change_history(customer_id: str) -> str:
     """Retrieve the history of all credit limit changes for a customer.
 
     Args:
         customer_id: The customer ID (e.g. CUST-1001)
     """
-    history = _bank_api("GET", f"/api/customers/{customer_id}/credit-history")
-    customer = _bank_api("GET", f"/api/customers/{customer_id}")
-    return json.dumps({
+    customer, history = await asyncio.gather(
+        _bank_api_async("GET", _P_CUSTOMER(customer_id)),
+        _bank_api_async("GET", _P_CREDIT_HISTORY(customer_id)),
+    )
+    return _dumps({
         "customer_id": customer_id,
         "current_limit": customer["current_credit_limit"],
         "change_history": history,
         "total_changes": len(history),
-    }, indent=2)
+    })
 
 
-@tool
+@tool(args_schema=_TransferArgs)
 def transfer_funds(from_account_id: str, to_account_id: str, amount: float, description: str) -> str:
     """Transfer funds between accounts. This writes to the bank database.
 
@@ -137,16 +472,18 @@ def transfer_funds(from_account_id: str, to_account_id: str, amount: float, desc
         amount: Amount to transfer in dollars
         description: Reason for the transfer
     """
-    result = _bank_api("POST", "/api/transfer", {
+    result = _bank_api("POST", _P_TRANSFER, {
         "from_account_id": from_account_id,
         "to_account_id": to_account_id,
         "amount": amount,
         "description": description,
     })
-    return json.dumps(result, indent=2)
+    reset_turn_cache()
+    return _dumps(result)
 
 
-@tool
+@tool(args_schema=_UpdateLimitArgs)
+@_require_customer_id
 def update_credit_limit(customer_id: str, new_limit: float, reason: str) -> str:
     """Apply a credit limit change for a customer. Only call this after receiving
     an approved assessment from the Credit Assessment Agent.
@@ -157,16 +494,30 @@ def update_credit_limit(customer_id: str, new_limit: float, reason: str) -> str:
         new_limit: The new credit limit amount in dollars
         reason: The reason for the credit limit change
     """
-    result = _bank_api("POST", f"/api/customers/{customer_id}/credit-limit", {
+    result = _bank_api("POST", _P_CREDIT_LIMIT(customer_id), {
         "new_limit": new_limit,
         "reason": reason,
         "assessed_by": "credit-assessment-agent",
     })
-    return json.dumps(result, indent=2)
+    _forget_customer(customer_id)
+    return _dumps(result)
+
+
+_ASSESSMENT_FIELDS = "customer,accounts,payment_history"
 
 
-@tool
-def request_credit_assessment(customer_id: str, requested_new_limit: float) -> str:
+async def _send_a2a_task(text: str) -> dict:
+    """Send one tasks/send request to the Credit Assessment Agent."""
+    # One id serves as both the task id and the JSON-RPC request id
+    task_id = uuid.uuid4().hex.encode()
+    resp = await _A2A_ASYNC.post(_A2A_URL, content=_A2A_TASK_SEND % (task_id, orjson.dumps(text), task_id))
+    resp.raise_for_status()
+    return orjson.loads(resp.content)
+
+
+@tool(args_schema=_AssessmentArgs)
+@_require_customer_id
+async def request_credit_assessment(customer_id: str, requested_new_limit: float) -> str:
     """Send customer data to the Credit Assessment Agent (via A2A) for a risk
     evaluation. Always call this BEFORE updating any credit limit.
 
@@ -174,99 +525,197 @@ def request_credit_assessment(customer_id: str, requested_new_limit: float) -> s
         customer_id: The customer ID to assess
         requested_new_limit: The new credit limit the customer is requesting
     """
-    # Fetch full customer data from the bank backend
-    customer = _bank_api("GET", f"/api/customers/{customer_id}")
-    accounts = _bank_api("GET", f"/api/customers/{customer_id}/accounts")
-
-    dti = customer["monthly_debt_payments"] * 12 / customer["annual_income"]
-    total_assets = sum(a["balance"] for a in accounts if a["type"] != "credit")
-    total_owed = sum(abs(a["balance"]) for a in accounts if a["type"] == "credit")
-
-    assessment_request = (
-        f"Please assess this credit limit increase request:\n\n"
-        f"Customer: {customer['name']} ({customer['id']})\n"
-        f"Current Credit Limit: ${customer['current_credit_limit']:,.2f}\n"
-        f"Requested New Limit: ${requested_new_limit:,.2f}\n"
-        f"Increase Amount: ${requested_new_limit - customer['current_credit_limit']:,.2f}\n\n"
-        f"Credit Score: {customer['credit_score']}\n"
-        f"Annual Income: ${customer['annual_income']:,.2f}\n"
-        f"Monthly Debt Payments: ${customer['monthly_debt_payments']:,.2f}\n"
-        f"Debt-to-Income Ratio: {dti:.2%}\n"
-        f"Account Age: {customer['account_age_months']} months\n"
-        f"Credit Utilization: {customer['utilization_rate']:.0%}\n"
-        f"Recent Inquiries: {customer['recent_inquiries']}\n"
-        f"Delinquencies (Last 2Y): {customer['delinquencies_last_2y']}\n\n"
-        f"Account Balances:\n"
-        f"  Total Assets: ${total_assets:,.2f}\n"
-        f"  Total Credit Owed: ${total_owed:,.2f}\n"
-    )
-
-    for a in accounts:
-        assessment_request += f"  {a['name']} ({a['type']}): ${a['balance']:,.2f}\n"
-
-    # Call Credit Assessment Agent via A2A
-    a2a_url = f"{KAGENT_CONTROLLER_URL}/api/a2a/{AGENT_NAMESPACE}/{CREDIT_ASSESSMENT_AGENT}/"
-    task_id = str(uuid.uuid4())
-
-    payload = {
-        "jsonrpc": "2.0",
-        "method": "tasks/send",
-        "params": {
-            "id": task_id,
-            "message": {"role": "user", "parts": [{"type": "text", "text": assessment_request}]},
-        },
-        "id": str(uuid.uuid4()),
-    }
+    # Fetch full customer data from the bank backend in one round-trip
+    bundle = await _bank_api_async("GET", _P_BUNDLE_FIELDS(customer_id, _ASSESSMENT_FIELDS))
+    assessment_request, scalars = _assessment_context(bundle, requested_new_limit)
 
     try:
-        with httpx.Client(timeout=60.0) as client:
-            resp = client.post(a2a_url, json=payload, headers={"Content-Type": "application/json"})
-            resp.raise_for_status()
-            result = resp.json()
-
-        if "result" in result:
-            task_result = result["result"]
-            if "status" in task_result and "message" in task_result["status"]:
-                parts = task_result["status"]["message"].get("parts", [])
-                text = "\n".join(p.get("text", "") for p in parts if p.get("type") == "text")
-                if text:
-                    return text
-            for artifact in task_result.get("artifacts", []):
-                for part in artifact.get("parts", []):
-                    if part.get("type") == "text":
-                        return part["text"]
-
-        return f"Agent response: {json.dumps(result, indent=2)}"
+        result = await _send_a2a_task(assessment_request)
+        return _extract_a2a_text(result) or f"Agent response: {_dumps(result)}"
 
     except httpx.ConnectError:
-        return _local_assessment(customer, requested_new_limit, dti)
+        return _local_assessment(scalars)
     except Exception as e:
-        return f"A2A error: {e}\n\n{_local_assessment(customer, requested_new_limit, dti)}"
+        return f"A2A error: {e}\n\n{_local_assessment(scalars)}"
 
 
-def _local_assessment(customer: dict, requested_new_limit: float, dti: float) -> str:
-    """Fallback local assessment when A2A agent is unreachable."""
-    score = customer["credit_score"]
-    risk_factors = []
-    if score < 670:
-        risk_factors.append(f"Below-average credit score ({score})")
-    if dti > 0.40:
-        risk_factors.append(f"High DTI ({dti:.0%})")
-    if customer["utilization_rate"] > 0.70:
-        risk_factors.append(f"High utilization ({customer['utilization_rate']:.0%})")
-    if customer["delinquencies_last_2y"] > 0:
-        risk_factors.append(f"{customer['delinquencies_last_2y']} delinquencies")
+_BATCH_INSTRUCTIONS = (
+    "Assess each of the following credit limit increase requests independently. "
+    "Reply with ONLY a JSON array containing one object per request, in order, with keys "
+    '"customer_id", "recommendation" (APPROVE, CONDITIONAL_APPROVE or DENY) and "risk_factors".'
+)
+
+
+@tool(args_schema=_BatchAssessmentArgs)
+async def request_credit_assessments_batch(customer_ids: list[str], requested_new_limits: list[float]) -> str:
+    """Assess several customers' credit limit requests in a single Credit Assessment
+    Agent (A2A) call. Use for portfolio reviews instead of one call per customer.
+
+    Args:
+        customer_ids: The customer IDs to assess
+        requested_new_limits: The requested new limit for each customer, in the same order
+    """
+    if len(customer_ids) != len(requested_new_limits):
+        return "customer_ids and requested_new_limits must have the same length."
+    if bad := [cid for cid in customer_ids if not _CID_RE.fullmatch(cid)]:
+        return f"Invalid customer ID format: {', '.join(bad)}. {await _ids_hint_async()}"
+
+    # A customer that can't be loaded is reported on its own; the rest are still assessed
+    bundles = await asyncio.gather(*(
+        _bank_api_async("GET", _P_BUNDLE_FIELDS(cid, _ASSESSMENT_FIELDS)) for cid in customer_ids
+    ), return_exceptions=True)
+    errors: dict[str, dict] = {}
+    contexts = []
+    for cid, bundle, limit in zip(customer_ids, bundles, requested_new_limits):
+        if isinstance(bundle, httpx.HTTPStatusError) and bundle.response.status_code == 404:
+            errors[cid] = {"error": f"Customer {cid} not found"}
+        elif isinstance(bundle, Exception):
+            errors[cid] = {"error": f"Could not load customer data: {bundle}"}
+        elif isinstance(bundle, BaseException):
+            raise bundle
+        else:
+            contexts.append(_assessment_context(bundle, limit))
+    if not contexts:
+        return _dumps(errors)
+
+    parts = [_BATCH_INSTRUCTIONS]
+    parts.extend(f"\n### Request {i}\n{prompt}" for i, (prompt, _) in enumerate(contexts, 1))
+
+    def local_verdicts() -> str:
+        return _dumps(errors | {scalars["customer_id"]: _local_verdict(scalars) for _, scalars in contexts})
+
+    try:
+        result = await _send_a2a_task("\n".join(parts))
+        text = _extract_a2a_text(result) or ""
+    except httpx.ConnectError:
+        return local_verdicts()
+    except Exception as e:
+        return f"A2A error: {e}\n\n{local_verdicts()}"
+
+    try:
+        verdicts = orjson.loads(text[text.find("["):text.rfind("]") + 1])
+        return _dumps(errors | {v["customer_id"]: v for v in verdicts})
+    except (orjson.JSONDecodeError, KeyError, TypeError):
+        reply = text or f"Agent response: {_dumps(result)}"
+        return f"{reply}\n\n{_dumps(errors)}" if errors else reply
+
+
+_EMPTY: dict = {}
+
+
+def _extract_a2a_text(result: dict) -> str | None:
+    """Text of a tasks/send result: the status message, then each artifact.
+
+    All text parts of the first source that has any are joined with newlines.
+    """
+    task = result.get("result", _EMPTY)
+    sources = [task.get("status", _EMPTY).get("message", _EMPTY).get("parts", ())]
+    sources.extend(a.get("parts", ()) for a in task.get("artifacts", ()))
+    texts = ("\n".join(p.get("text", "") for p in parts if p.get("type") == "text") for parts in sources)
+    return next(filter(None, texts), None)
+
+
+def _amount(value: float) -> str:
+    """Dollars to the cent, without trailing zeros: 2500.0000000000005 -> 2500."""
+    return f"{value:.2f}".rstrip("0").rstrip(".")
+
+
+def _rate(value: float) -> str:
+    return f"{value:.4f}".rstrip("0").rstrip(".")
+
+
+def _assessment_context(bundle: dict, requested_new_limit: float) -> tuple[str, dict]:
+    """Render the A2A assessment prompt from a customer bundle.
+
+    Also returns the scalars the prompt was built from, so the local fallback
+    evaluates exactly the same numbers.
+    """
+    customer, accounts = bundle["customer"], bundle["accounts"]
+    current = customer["current_credit_limit"]
+    scalars = {
+        "customer_id": customer["id"],
+        "credit_score": customer["credit_score"],
+        "dti": customer["dti"],
+        "utilization_rate": customer["utilization_rate"],
+        "delinquencies": customer["delinquencies_last_2y"],
+        "on_time_rate": customer["on_time_rate_6m"],
+        # No rate for a customer without a limit yet
+        "increase_pct": (requested_new_limit - current) / current if current else None,
+    }
+
+    total_assets, total_owed = _account_totals(accounts)
+
+    # Plain numbers, no currency/percent formatting: the model reads them just
+    # as well and this runs once per customer in batched assessments. Rounded,
+    # so float noise doesn't cost tokens either.
+    parts = [
+        "Please assess this credit limit increase request (amounts in USD, rates as fractions):\n",
+        f"Customer: {customer['name']} ({customer['id']})",
+        f"Current Credit Limit: {_amount(current)}",
+        f"Requested New Limit: {_amount(requested_new_limit)}",
+        f"Increase Amount: {_amount(requested_new_limit - current)}"
+        + (f" (increase rate {_rate(scalars['increase_pct'])})\n" if current else " (no current limit)\n"),
+        f"Credit Score: {customer['credit_score']}",
+        f"Annual Income: {_amount(customer['annual_income'])}",
+        f"Monthly Debt Payments: {_amount(customer['monthly_debt_payments'])}",
+        # dti is NULL from the backend when there is no income on file
+        f"Debt-to-Income Ratio: {'unknown (no income)' if scalars['dti'] is None else _rate(scalars['dti'])}",
+        f"Account Age: {customer['account_age_months']} months",
+        f"Credit Utilization: {_rate(customer['utilization_rate'])}",
+        f"Recent Inquiries: {customer['recent_inquiries']}",
+        f"Delinquencies (Last 2Y): {customer['delinquencies_last_2y']}\n",
+        "Account Balances:",
+        f"  Total Assets: {_amount(total_assets)}",
+        f"  Total Credit Owed: {_amount(total_owed)}",
+    ]
+    parts.extend(f"  {a['name']} ({a['type']}): {_amount(a['balance'])}" for a in accounts)
+
+    history = bundle["payment_history"]
+    if history:
+        parts.append(f"\nRecent Payments (on-time rate {_rate(scalars['on_time_rate'])} over 6 months):")
+        parts.extend(
+            f"  {p['month']}: {_amount(p['amount_paid'])} of {_amount(p['amount_due'])}"
+            f" ({'on time' if p['on_time'] else 'late'})"
+            for p in itertools.islice(history, 6)
+        )
+    return "\n".join(parts) + "\n", scalars
+
+
+# Fallback risk rules as (condition, message) pairs over the assessment scalars.
+_RULES = [
+    (lambda s: s["credit_score"] < 670,
+     lambda s: f"Below-average credit score ({s['credit_score']})"),
+    (lambda s: s["dti"] is None,
+     lambda s: "Unknown DTI (no income on file)"),
+    (lambda s: s["dti"] is not None and s["dti"] > 0.40,
+     lambda s: f"High DTI ({s['dti']:.0%})"),
+    (lambda s: s["utilization_rate"] > 0.70,
+     lambda s: f"High utilization ({s['utilization_rate']:.0%})"),
+    (lambda s: s["delinquencies"] > 0,
+     lambda s: f"{s['delinquencies']} delinquencies"),
+]
+
+
+def _local_verdict(scalars: dict) -> dict:
+    score = scalars["credit_score"]
+    risk_factors = [msg(scalars) for cond, msg in _RULES if cond(scalars)]
 
     rec = "APPROVE" if not risk_factors else ("CONDITIONAL_APPROVE" if score >= 700 else "DENY")
-    return json.dumps({
+    return {
         "source": "LOCAL_FALLBACK",
         "recommendation": rec,
         "risk_factors": risk_factors,
-        "customer_id": customer["id"],
-    }, indent=2)
+        "customer_id": scalars["customer_id"],
+    }
 
 
-@tool
+def _local_assessment(scalars: dict) -> str:
+    """Fallback local assessment when A2A agent is unreachable."""
+    return _dumps(_local_verdict(scalars))
+
+
+@tool(args_schema=_ApprovalArgs)
+@_require_customer_id
 def create_credit_limit_approval(
     customer_id: str, requested_limit: float, reason: str, risk_summary: str,
 ) -> str:
@@ -279,17 +728,17 @@ def create_credit_limit_approval(
         reason: Why the customer is requesting an increase
         risk_summary: Summary of risk factors from the credit assessment
     """
-    customer = _bank_api("GET", f"/api/customers/{customer_id}")
-    result = _bank_api("POST", f"/api/customers/{customer_id}/credit-limit-approval", {
+    result = _bank_api("POST", _P_CREDIT_LIMIT_APPROVAL(customer_id), {
         "requested_new_limit": requested_limit,
-        "current_limit": customer["current_credit_limit"],
         "reason": reason,
         "assessment_summary": risk_summary,
     })
-    return json.dumps(result, indent=2)
+    _forget_customer(customer_id)
+    return _dumps(result)
 
 
 banking_tools = [
+    get_customer_bundle,
     get_customer_profile,
     get_credit_score,
     get_account_balances,
@@ -298,6 +747,7 @@ banking_tools = [
     get_credit_limit_change_history,
     transfer_funds,
     request_credit_assessment,
+    request_credit_assessments_batch,
     update_credit_limit,
     create_credit_limit_approval,
 ]
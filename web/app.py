@@ -1,12 +1,19 @@
 """Solo Bank — FastAPI backend serving the bank website and REST API."""
 
+import asyncio
+import hashlib
 import os
+import re
+import sqlite3
 import uuid
+from contextlib import asynccontextmanager
+from urllib.parse import parse_qs
 import httpx
-from fastapi import FastAPI, HTTPException
+import orjson
+from fastapi import FastAPI, HTTPException, Request
 from fastapi.staticfiles import StaticFiles
-from fastapi.responses import FileResponse
-from pydantic import BaseModel
+from fastapi.responses import Response
+from pydantic import BaseModel, ConfigDict
 
 import database as db
 
@@ -17,110 +24,206 @@ KAGENT_CONTROLLER_URL = os.environ.get(
 AGENT_NAMESPACE = os.environ.get("AGENT_NAMESPACE", "kagent")
 CREDIT_AGENT = os.environ.get("CREDIT_AGENT_NAME", "bank-credit-limit-agent")
 
-app = FastAPI(title="Solo Bank", version="1.0.0")
+# Shared client so chat requests reuse connections to the kagent controller
+_A2A_CLIENT = httpx.AsyncClient(timeout=120.0, headers={"Content-Type": "application/json"})
+_A2A_URL = f"{KAGENT_CONTROLLER_URL}/api/a2a/{AGENT_NAMESPACE}/{CREDIT_AGENT}/"
+# JSON-RPC message/send request with the static parts pre-encoded; fill with
+# (orjson-encoded message text, request id).
+_A2A_MESSAGE_SEND = (
+    b'{"jsonrpc":"2.0","method":"message/send","params":{"message":'
+    b'{"role":"user","parts":[{"kind":"text","text":%b}]}},"id":"%b"}'
+)
+
+
+@asynccontextmanager
+async def _lifespan(app: FastAPI):
+    await asyncio.to_thread(db.init_db)
+    yield
+    await _A2A_CLIENT.aclose()
+
+
+app = FastAPI(
+    title="Solo Bank",
+    version="1.0.0",
+    lifespan=_lifespan,
+)
 
 
 # ---- Pydantic models ----
 
-class TransferRequest(BaseModel):
+class _Request(BaseModel):
+    # Pydantic v2 (Rust-backed) parsing; bodies are read-only and unknown keys dropped
+    model_config = ConfigDict(extra="ignore", frozen=True)
+
+
+class TransferRequest(_Request):
     from_account_id: str
     to_account_id: str
     amount: float
     description: str = ""
 
 
-class ApprovalAction(BaseModel):
+class ApprovalAction(_Request):
     action: str  # "approve" or "deny"
 
 
-class CreditLimitUpdate(BaseModel):
+class CreditLimitUpdate(_Request):
     new_limit: float
     reason: str
     assessed_by: str = "credit-assessment-agent"
 
 
-class CreditLimitApprovalRequest(BaseModel):
+class CreditLimitApprovalRequest(_Request):
     requested_new_limit: float
-    current_limit: float
     reason: str
     assessment_summary: str
 
 
-class ChatMessage(BaseModel):
+class ChatMessage(_Request):
     customer_id: str
     message: str
 
 
+# ---- JSON helpers ----
+
+def _row_default(o):
+    if isinstance(o, sqlite3.Row):
+        return {k: o[k] for k in o.keys()}
+    raise TypeError
+
+
+def _rows_response(rows: list[sqlite3.Row]) -> Response:
+    """Serialize query rows to a JSON body with orjson, skipping FastAPI's encoder pass.
+
+    Each row is still converted to a dict (in _row_default) on the way out.
+    """
+    return Response(
+        content=orjson.dumps(rows, default=_row_default),
+        media_type="application/json",
+        headers={"X-Result-Count": str(len(rows))},
+    )
+
+
+def _cursor(before_ts: str | None, before_id: int | None) -> tuple[str, int] | None:
+    """Keyset cursor from the last row of the previous page (both parts or neither)."""
+    if (before_ts is None) != (before_id is None):
+        raise HTTPException(400, "before_ts and before_id must be given together")
+    return None if before_ts is None else (before_ts, before_id)
+
+
+def _etag_response(request: Request, payload) -> Response:
+    """JSON response with a content ETag; 304 when the client already holds it."""
+    body = orjson.dumps(payload, default=_row_default)
+    etag = f'W/"{hashlib.blake2b(body, digest_size=8).hexdigest()}"'
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers={"ETag": etag})
+    return Response(content=body, media_type="application/json", headers={"ETag": etag})
+
+
 # ---- API routes ----
 
 @app.get("/api/customers")
-def list_customers():
-    return db.get_all_customers()
+async def list_customers():
+    return _rows_response(await asyncio.to_thread(db.get_all_customers))
 
 
 @app.get("/api/customers/{customer_id}")
-def get_customer(customer_id: str):
-    c = db.get_customer(customer_id)
+async def get_customer(customer_id: str, request: Request):
+    c = await asyncio.to_thread(db.get_customer, customer_id)
     if not c:
         raise HTTPException(404, "Customer not found")
-    c.pop("pin", None)
-    return c
+    return _etag_response(request, {k: v for k, v in c.items() if k != "pin"})
 
 
 @app.get("/api/customers/{customer_id}/accounts")
-def get_accounts(customer_id: str):
-    return db.get_accounts(customer_id)
+async def get_accounts(customer_id: str, request: Request):
+    return _etag_response(request, await asyncio.to_thread(db.get_accounts, customer_id))
+
+
+@app.get("/api/customers/{customer_id}/balances-summary")
+async def get_balance_summary(customer_id: str):
+    return await asyncio.to_thread(db.get_balance_summary, customer_id)
+
+
+@app.get("/api/customers/{customer_id}/payment-summary")
+async def get_payment_summary(customer_id: str):
+    return await asyncio.to_thread(db.get_payment_history_summary, customer_id)
+
+
+@app.get("/api/customers/{customer_id}/bundle")
+async def get_customer_bundle(customer_id: str, limit: int = 30, fields: str | None = None):
+    """Everything the agent tools need about a customer in a single round-trip.
+
+    ``fields`` is an optional comma-separated subset of sections, e.g. ``customer,accounts``.
+    """
+    selected = db.BUNDLE_FIELDS
+    if fields:
+        requested = set(fields.split(","))
+        if unknown := requested.difference(db.BUNDLE_FIELDS):
+            raise HTTPException(400, f"Unknown bundle fields: {', '.join(sorted(unknown))}")
+        selected = tuple(f for f in db.BUNDLE_FIELDS if f in requested)
+    bundle = await asyncio.to_thread(db.get_customer_bundle_json, customer_id, limit, selected)
+    if bundle is None:
+        raise HTTPException(404, "Customer not found")
+    return Response(content=bundle, media_type="application/json")
 
 
 @app.get("/api/customers/{customer_id}/transactions")
-def get_transactions(customer_id: str, limit: int = 30):
-    return db.get_all_transactions(customer_id, limit)
+async def get_transactions(customer_id: str, limit: int = 30):
+    return _rows_response(await asyncio.to_thread(db.get_all_transactions, customer_id, limit))
 
 
 @app.get("/api/accounts/{account_id}/transactions")
-def get_account_transactions(account_id: str, limit: int = 20):
-    return db.get_transactions(account_id, limit)
+async def get_account_transactions(account_id: str, limit: int = 20):
+    return _rows_response(await asyncio.to_thread(db.get_transactions, account_id, limit))
 
 
 @app.post("/api/transfer")
-def transfer(req: TransferRequest):
-    result = db.transfer_funds(req.from_account_id, req.to_account_id, req.amount, req.description)
+async def transfer(req: TransferRequest):
+    result = await asyncio.to_thread(
+        db.transfer_funds, req.from_account_id, req.to_account_id, req.amount, req.description,
+    )
     if "error" in result:
         raise HTTPException(400, result["error"])
     return result
 
 
 @app.get("/api/customers/{customer_id}/approvals")
-def get_approvals(customer_id: str):
-    return db.get_pending_approvals(customer_id)
+async def get_approvals(customer_id: str):
+    return _rows_response(await asyncio.to_thread(db.get_pending_approvals, customer_id))
 
 
 @app.post("/api/approvals/{approval_id}")
-def resolve_approval(approval_id: int, req: ApprovalAction):
-    result = db.resolve_approval(approval_id, req.action)
+async def resolve_approval(approval_id: int, req: ApprovalAction):
+    result = await asyncio.to_thread(db.resolve_approval, approval_id, req.action)
     if "error" in result:
         raise HTTPException(400, result["error"])
     return result
 
 
 @app.get("/api/customers/{customer_id}/credit-history")
-def credit_history(customer_id: str):
-    return db.get_credit_limit_history(customer_id)
+async def credit_history(
+    customer_id: str, limit: int = -1, before_ts: str | None = None, before_id: int | None = None,
+):
+    before = _cursor(before_ts, before_id)
+    return _rows_response(await asyncio.to_thread(db.get_credit_limit_history, customer_id, limit, before))
 
 
 @app.post("/api/customers/{customer_id}/credit-limit")
-def update_credit_limit(customer_id: str, req: CreditLimitUpdate):
-    result = db.update_credit_limit(customer_id, req.new_limit, req.reason, req.assessed_by)
+async def update_credit_limit(customer_id: str, req: CreditLimitUpdate):
+    result = await asyncio.to_thread(
+        db.update_credit_limit, customer_id, req.new_limit, req.reason, req.assessed_by,
+    )
     if "error" in result:
         raise HTTPException(400, result["error"])
     return result
 
 
 @app.post("/api/customers/{customer_id}/credit-limit-approval")
-def create_credit_limit_approval(customer_id: str, req: CreditLimitApprovalRequest):
-    result = db.create_credit_limit_approval(
-        customer_id, req.requested_new_limit, req.current_limit,
-        req.reason, req.assessment_summary,
+async def create_credit_limit_approval(customer_id: str, req: CreditLimitApprovalRequest):
+    result = await asyncio.to_thread(
+        db.create_credit_limit_approval,
+        customer_id, req.requested_new_limit, req.reason, req.assessment_summary,
     )
     if "error" in result:
         raise HTTPException(400, result["error"])
@@ -128,50 +231,37 @@ def create_credit_limit_approval(customer_id: str, req: CreditLimitApprovalReque
 
 
 @app.get("/api/approvals")
-def get_all_approvals():
-    return db.get_all_pending_approvals()
+async def get_all_approvals(limit: int = -1, before_ts: str | None = None, before_id: int | None = None):
+    before = _cursor(before_ts, before_id)
+    return _rows_response(await asyncio.to_thread(db.get_all_pending_approvals, limit, before))
+
+
+_EMPTY: dict = {}
+
+
+def _extract_a2a_text(result: dict) -> str | None:
+    """Text of a message/send result: each artifact (the final answer), then the status.
+
+    All text parts of the first source that has any are joined with newlines.
+    """
+    task = result.get("result", _EMPTY)
+    sources = [a.get("parts", ()) for a in task.get("artifacts", ())]
+    sources.append(task.get("status", _EMPTY).get("message", _EMPTY).get("parts", ()))
+    texts = ("\n".join(p.get("text", "") for p in parts if p.get("kind") == "text") for parts in sources)
+    return next(filter(None, texts), None)
 
 
 @app.post("/api/chat")
-def chat_with_agent(req: ChatMessage):
+async def chat_with_agent(req: ChatMessage):
     """Send a message to the Bank Credit Limit Agent via A2A."""
-    a2a_url = f"{KAGENT_CONTROLLER_URL}/api/a2a/{AGENT_NAMESPACE}/{CREDIT_AGENT}/"
-    task_id = str(uuid.uuid4())
-
-    payload = {
-        "jsonrpc": "2.0",
-        "method": "message/send",
-        "params": {
-            "message": {
-                "role": "user",
-                "parts": [{"kind": "text", "text": req.message}],
-            },
-        },
-        "id": str(uuid.uuid4()),
-    }
+    task_id = uuid.uuid4().hex
+    body = _A2A_MESSAGE_SEND % (orjson.dumps(req.message), task_id.encode())
 
     try:
-        with httpx.Client(timeout=120.0) as client:
-            resp = client.post(a2a_url, json=payload, headers={"Content-Type": "application/json"})
-            resp.raise_for_status()
-            result = resp.json()
-
-        # Extract response text from A2A message/send result
-        if "result" in result:
-            task_result = result["result"]
-            # Check artifacts first (contains final response)
-            for artifact in task_result.get("artifacts", []):
-                for part in artifact.get("parts", []):
-                    if part.get("kind") == "text":
-                        return {"response": part["text"], "task_id": task_id}
-            # Check status message
-            if "status" in task_result and "message" in task_result["status"]:
-                parts = task_result["status"]["message"].get("parts", [])
-                text = "\n".join(p.get("text", "") for p in parts if p.get("kind") == "text")
-                if text:
-                    return {"response": text, "task_id": task_id}
-
-        return {"response": f"Agent responded: {result}", "task_id": task_id}
+        resp = await _A2A_CLIENT.post(_A2A_URL, content=body)
+        resp.raise_for_status()
+        result = orjson.loads(resp.content)
+        return {"response": _extract_a2a_text(result) or f"Agent responded: {result}", "task_id": task_id}
 
     except httpx.ConnectError:
         return {
@@ -185,10 +275,40 @@ def chat_with_agent(req: ChatMessage):
 
 # ---- Serve frontend ----
 
+class CachedStaticFiles(StaticFiles):
+    """Versioned asset URLs (?v=<content hash>) are cached for a year; the rest revalidate."""
+
+    def file_response(self, full_path, stat_result, scope, status_code=200):
+        response = super().file_response(full_path, stat_result, scope, status_code)
+        if "v" in parse_qs(scope.get("query_string", b"").decode("latin-1")):
+            response.headers["Cache-Control"] = "public, max-age=31536000, immutable"
+        else:
+            response.headers["Cache-Control"] = "no-cache"
+        return response
+
+
 static_dir = os.path.join(os.path.dirname(__file__), "static")
-app.mount("/static", StaticFiles(directory=static_dir), name="static")
+app.mount("/static", CachedStaticFiles(directory=static_dir), name="static")
+
+
+def _fingerprint_assets(html: bytes) -> bytes:
+    """Append ?v=<content hash> to /static/ URLs so a changed asset gets a new URL."""
+    def versioned(m: re.Match) -> bytes:
+        with open(os.path.join(static_dir, m.group(1).decode()), "rb") as f:
+            digest = hashlib.sha1(f.read()).hexdigest()[:12]
+        return m.group(0) + b"?v=" + digest.encode()
+    return re.sub(rb'/static/([\w./-]+)(?=")', versioned, html)
+
+
+# The SPA entry point never changes at runtime: read it once, revalidate by ETag
+with open(os.path.join(static_dir, "index.html"), "rb") as f:
+    _INDEX_BYTES = _fingerprint_assets(f.read())
+_INDEX_ETAG = f'"{hashlib.sha1(_INDEX_BYTES).hexdigest()}"'
+_INDEX_HEADERS = {"ETag": _INDEX_ETAG, "Cache-Control": "no-cache"}
 
 
 @app.get("/")
-def index():
-    return FileResponse(os.path.join(static_dir, "index.html"))
+async def index(request: Request):
+    if request.headers.get("if-none-match") == _INDEX_ETAG:
+        return Response(status_code=304, headers=_INDEX_HEADERS)
+    return Response(_INDEX_BYTES, media_type="text/html", headers=_INDEX_HEADERS)
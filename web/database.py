@@ -1,8 +1,10 @@
 """SQLite database for Solo Bank — accounts, balances, transactions, transfers."""
 
+import functools
 import os
+import queue
 import sqlite3
-from datetime import datetime, timezone
+import threading
 from contextlib import contextmanager
 
 DB_PATH = os.environ.get("BANK_DB_PATH", "/data/bank.db")
@@ -18,21 +20,185 @@ def _get_db_path() -> str:
 _DB = _get_db_path()
 
 
-@contextmanager
-def get_db():
-    conn = sqlite3.connect(_DB)
+def _connect(query_only: bool = False) -> sqlite3.Connection:
+    # Autocommit mode: get_write_db() issues BEGIN/COMMIT itself.
+    # Room for every statement below, so each is compiled once per connection.
+    conn = sqlite3.connect(_DB, check_same_thread=False, isolation_level=None, cached_statements=256)
     conn.row_factory = sqlite3.Row
-    conn.execute("PRAGMA journal_mode=WAL")
-    conn.execute("PRAGMA foreign_keys=ON")
+    # page_size only takes effect on a brand-new file (before WAL is enabled);
+    # on an existing database it is a no-op. synchronous=NORMAL is durable
+    # under WAL apart from the last commits on power loss.
+    conn.executescript("""
+        PRAGMA page_size=8192;
+        PRAGMA journal_mode=WAL;
+        PRAGMA synchronous=NORMAL;
+        PRAGMA temp_store=MEMORY;
+        PRAGMA cache_size=-64000;
+        PRAGMA mmap_size=268435456;
+        PRAGMA busy_timeout=5000;
+        PRAGMA foreign_keys=ON;
+    """)
+    if query_only:
+        conn.execute("PRAGMA query_only=ON")
+    return conn
+
+
+# One writer plus a small pool of read-only connections, all kept open so
+# SQLite's page cache stays warm. Under WAL readers never block the writer (or
+# each other); writes are serialized on the writer's lock.
+_WRITER = _connect()
+_WRITE_LOCK = threading.RLock()
+_write_depth = 0
+# Bumped after every write transaction that changed rows; read caches key on it (_cached_read).
+_write_gen = 0
+
+_READER_COUNT = 4
+_READERS: queue.Queue[sqlite3.Connection] = queue.Queue()
+for _ in range(_READER_COUNT):
+    _READERS.put(_connect(query_only=True))
+
+
+@contextmanager
+def get_write_db():
+    """Yield the writer connection; the outermost block is one transaction.
+
+    Nested blocks on the same thread (resolve_approval -> update_credit_limit)
+    join the enclosing transaction instead of starting their own.
+    """
+    global _write_depth, _write_gen
+    with _WRITE_LOCK:
+        outer = _write_depth == 0
+        if outer:
+            changes = _WRITER.total_changes
+            # Take the write lock up front rather than upgrading mid-transaction
+            _WRITER.execute("BEGIN IMMEDIATE")
+        _write_depth += 1
+        try:
+            yield _WRITER
+        except BaseException:
+            if outer and _WRITER.in_transaction:
+                _WRITER.execute("ROLLBACK")
+            raise
+        else:
+            # executescript() commits on its own, so the transaction may be gone
+            if outer and _WRITER.in_transaction:
+                _WRITER.execute("COMMIT")
+        finally:
+            _write_depth -= 1
+            # A rejected write (nothing changed) leaves the read caches alone
+            if outer and _WRITER.total_changes != changes:
+                _write_gen += 1
+
+
+def _cached_read(func):
+    """LRU-cache a read helper until the next write.
+
+    Entries are keyed on _write_gen, so anything cached before a commit is never
+    served after it and simply ages out. Cached results are shared: callers
+    must not mutate them.
+    """
+    cached = functools.lru_cache(maxsize=256)(lambda gen, *args: func(*args))
+
+    @functools.wraps(func)
+    def wrapper(*args):
+        return cached(_write_gen, *args)
+
+    return wrapper
+
+
+@contextmanager
+def get_read_db():
+    """Borrow a read-only connection from the pool (blocks while all are busy)."""
+    conn = _READERS.get()
     try:
         yield conn
-        conn.commit()
     finally:
-        conn.close()
+        _READERS.put(conn)
+
+
+# Secondary indexes, built after seeding so the bulk insert doesn't maintain them row by row.
+# Ascending: newest-first listings scan them backwards, ties broken by rowid.
+# init_db() skips databases already at the latest user_version, so an index
+# added here would never reach them: add new indexes as _MIGRATIONS entries.
+_SQL_INDEXES = """
+    CREATE INDEX IF NOT EXISTS idx_tx_acc_ts ON transactions(account_id, timestamp);
+    CREATE INDEX IF NOT EXISTS idx_tx_cust_ts ON transactions(customer_id, timestamp);
+    CREATE INDEX IF NOT EXISTS idx_pa_cust_status ON pending_approvals(customer_id, status, timestamp);
+    CREATE INDEX IF NOT EXISTS idx_clc_cust_ts ON credit_limit_changes(customer_id, timestamp);
+    CREATE INDEX IF NOT EXISTS idx_acc_cust_type ON accounts(customer_id, type);
+    CREATE INDEX IF NOT EXISTS idx_ph_cust_month ON payment_history(customer_id, month);
+"""
+
+# Schema changes since the original tables, applied in order and tracked in
+# PRAGMA user_version (entry i brings the database to version i + 1).
+_MIGRATIONS = [
+    # Denormalize the display names the dashboard lists would otherwise JOIN
+    # for; triggers fill them on insert and follow the (rare) renames.
+    """
+    ALTER TABLE transactions ADD COLUMN account_name TEXT;
+    ALTER TABLE transactions ADD COLUMN account_type TEXT;
+    UPDATE transactions SET
+        account_name = (SELECT name FROM accounts WHERE id = transactions.account_id),
+        account_type = (SELECT type FROM accounts WHERE id = transactions.account_id);
+    CREATE TRIGGER trg_tx_account AFTER INSERT ON transactions WHEN NEW.account_name IS NULL
+    BEGIN
+        UPDATE transactions SET
+            account_name = (SELECT name FROM accounts WHERE id = NEW.account_id),
+            account_type = (SELECT type FROM accounts WHERE id = NEW.account_id)
+        WHERE id = NEW.id;
+    END;
+    CREATE TRIGGER trg_account_rename AFTER UPDATE OF name, type ON accounts
+    BEGIN
+        UPDATE transactions SET account_name = NEW.name, account_type = NEW.type WHERE account_id = NEW.id;
+    END;
+
+    ALTER TABLE pending_approvals ADD COLUMN customer_name TEXT;
+    UPDATE pending_approvals SET
+        customer_name = (SELECT name FROM customers WHERE id = pending_approvals.customer_id);
+    CREATE TRIGGER trg_pa_customer AFTER INSERT ON pending_approvals WHEN NEW.customer_name IS NULL
+    BEGIN
+        UPDATE pending_approvals SET customer_name = (SELECT name FROM customers WHERE id = NEW.customer_id)
+        WHERE id = NEW.id;
+    END;
+    CREATE TRIGGER trg_customer_rename AFTER UPDATE OF name ON customers
+    BEGIN
+        UPDATE pending_approvals SET customer_name = NEW.name WHERE customer_id = NEW.id;
+    END;
+    """,
+    # The account an approved transaction (wire transfer, large purchase) debits.
+    # Existing ones always targeted the customer's checking account.
+    """
+    ALTER TABLE pending_approvals ADD COLUMN target_account_id TEXT REFERENCES accounts(id);
+    UPDATE pending_approvals SET target_account_id = (
+        SELECT id FROM accounts WHERE customer_id = pending_approvals.customer_id AND type = 'checking'
+    ) WHERE type <> 'CREDIT_LIMIT_INCREASE';
+    """,
+    # Partial indexes over live work only, which stays small while resolved rows pile up.
+    """
+    CREATE INDEX IF NOT EXISTS idx_pa_pending ON pending_approvals(timestamp) WHERE status = 'PENDING';
+    CREATE INDEX IF NOT EXISTS idx_clc_pending ON credit_limit_changes(customer_id, new_limit)
+        WHERE status = 'PENDING_REVIEW';
+    """,
+]
+
+
+def _migrate(conn: sqlite3.Connection) -> None:
+    version = conn.execute("PRAGMA user_version").fetchone()[0]
+    for target, script in enumerate(_MIGRATIONS[version:], version + 1):
+        conn.executescript(f"BEGIN; {script}; PRAGMA user_version={target}; COMMIT;")
 
 
 def init_db():
-    with get_db() as conn:
+    """Create, seed and migrate the database; called once at app startup.
+
+    A database already at the latest user_version is left untouched, without
+    taking the write lock, so every schema change after the initial tables and
+    _SQL_INDEXES (indexes included) must be a _MIGRATIONS entry.
+    """
+    with get_read_db() as conn:
+        if conn.execute("PRAGMA user_version").fetchone()[0] == len(_MIGRATIONS):
+            return
+    with get_write_db() as conn:
         conn.executescript("""
             CREATE TABLE IF NOT EXISTS customers (
                 id TEXT PRIMARY KEY,
@@ -112,196 +278,388 @@ def init_db():
                 resolved_by TEXT
             );
         """)
+        if not conn.execute("SELECT EXISTS (SELECT 1 FROM customers)").fetchone()[0]:
+            # executescript() committed the outer transaction; seed in one of its own
+            conn.execute("BEGIN IMMEDIATE")
+            _seed(conn)
+            conn.execute("COMMIT")
+        conn.executescript(_SQL_INDEXES)
+        # After seeding, so the migrations backfill the seed rows like any others
+        _migrate(conn)
+
+
+def _insert_rows(conn: sqlite3.Connection, insert: str, rows: list[tuple]) -> None:
+    """One multi-row INSERT ... VALUES (...),(...) rather than a statement run per row."""
+    group = "(" + ",".join("?" * len(rows[0])) + ")"
+    conn.execute(f"{insert} VALUES {','.join([group] * len(rows))}", [v for row in rows for v in row])
+
+
+def _seed(conn: sqlite3.Connection) -> None:
+    # --- Customers ---
+    customers = [
+        ("CUST-1001", "Alice Johnson", "alice.johnson@solobank.com", "1234", 780, 10000, 48, 95000, 1200, 0.35, 1, 0),
+        ("CUST-1002", "Bob Martinez", "bob.martinez@solobank.com", "1234", 650, 5000, 18, 55000, 1800, 0.78, 4, 2),
+        ("CUST-1003", "Carol Chen", "carol.chen@solobank.com", "1234", 720, 15000, 36, 120000, 2500, 0.52, 2, 1),
+        ("CUST-1004", "David Park", "david.park@solobank.com", "1234", 820, 25000, 72, 150000, 3000, 0.22, 0, 0),
+    ]
+    _insert_rows(conn, "INSERT INTO customers", customers)
+
+    # --- Accounts ---
+    accounts = [
+        ("ACC-1001-CHK", "CUST-1001", "checking", "Checking Account", 12450.00, "USD"),
+        ("ACC-1001-SAV", "CUST-1001", "savings", "Savings Account", 34200.00, "USD"),
+        ("ACC-1001-CRD", "CUST-1001", "credit", "Platinum Credit Card", -3500.00, "USD"),
+
+        ("ACC-1002-CHK", "CUST-1002", "checking", "Checking Account", 2100.00, "USD"),
+        ("ACC-1002-SAV", "CUST-1002", "savings", "Savings Account", 800.00, "USD"),
+        ("ACC-1002-CRD", "CUST-1002", "credit", "Gold Credit Card", -3900.00, "USD"),
+
+        ("ACC-1003-CHK", "CUST-1003", "checking", "Checking Account", 28700.00, "USD"),
+        ("ACC-1003-SAV", "CUST-1003", "savings", "Savings Account", 15600.00, "USD"),
+        ("ACC-1003-CRD", "CUST-1003", "credit", "Platinum Credit Card", -7800.00, "USD"),
+
+        ("ACC-1004-CHK", "CUST-1004", "checking", "Checking Account", 45300.00, "USD"),
+        ("ACC-1004-SAV", "CUST-1004", "savings", "Savings Account", 89000.00, "USD"),
+        ("ACC-1004-CRD", "CUST-1004", "credit", "Black Credit Card", -5500.00, "USD"),
+    ]
+    _insert_rows(conn, "INSERT INTO accounts", accounts)
+
+    # --- Transactions ---
+    txns = [
+        ("ACC-1001-CHK", "CUST-1001", "2026-02-25T14:30:00Z", "PURCHASE", "Amazon - Electronics", -289.99, 12160.01, None),
+        ("ACC-1001-CHK", "CUST-1001", "2026-02-20T09:00:00Z", "PAYMENT", "Credit card payment", -2500.00, 12450.00, "ACC-1001-CRD"),
+        ("ACC-1001-CHK", "CUST-1001", "2026-02-15T08:00:00Z", "DEPOSIT", "Payroll - TechCorp Inc", 3958.33, 14950.00, None),
+        ("ACC-1001-CHK", "CUST-1001", "2026-02-10T12:15:00Z", "PURCHASE", "Whole Foods Market", -156.42, 10991.67, None),
+        ("ACC-1001-CHK", "CUST-1001", "2026-02-01T08:00:00Z", "PAYMENT", "Mortgage payment", -1800.00, 11148.09, None),
+        ("ACC-1001-SAV", "CUST-1001", "2026-02-15T08:05:00Z", "DEPOSIT", "Auto-save from checking", 500.00, 34200.00, "ACC-1001-CHK"),
+
+        ("ACC-1002-CHK", "CUST-1002", "2026-02-24T16:45:00Z", "PURCHASE", "Shell Gas Station", -62.50, 2037.50, None),
+        ("ACC-1002-CHK", "CUST-1002", "2026-02-18T10:00:00Z", "PAYMENT", "Minimum CC payment", -150.00, 2100.00, "ACC-1002-CRD"),
+        ("ACC-1002-CHK", "CUST-1002", "2026-02-15T08:00:00Z", "DEPOSIT", "Payroll - RetailMax", 2291.67, 2250.00, None),
+        ("ACC-1002-CHK", "CUST-1002", "2026-02-05T14:20:00Z", "WITHDRAWAL", "ATM Withdrawal", -200.00, -41.67, None),
+        ("ACC-1002-CRD", "CUST-1002", "2026-02-01T11:30:00Z", "PURCHASE", "Best Buy - 65\" TV", -899.99, -3900.00, None),
+
+        ("ACC-1003-CHK", "CUST-1003", "2026-02-26T09:10:00Z", "PURCHASE", "Delta Airlines - SFO to JFK", -487.00, 28213.00, None),
+        ("ACC-1003-CHK", "CUST-1003", "2026-02-22T10:00:00Z", "PAYMENT", "Credit card full payment", -4200.00, 28700.00, "ACC-1003-CRD"),
+        ("ACC-1003-CHK", "CUST-1003", "2026-02-15T08:00:00Z", "DEPOSIT", "Payroll - Acme Corp", 5000.00, 32900.00, None),
+        ("ACC-1003-CHK", "CUST-1003", "2026-02-08T15:30:00Z", "TRANSFER", "Transfer to savings", -2000.00, 27900.00, "ACC-1003-SAV"),
+        ("ACC-1003-SAV", "CUST-1003", "2026-02-08T15:30:00Z", "TRANSFER", "Transfer from checking", 2000.00, 15600.00, "ACC-1003-CHK"),
+
+        ("ACC-1004-CHK", "CUST-1004", "2026-02-25T07:30:00Z", "PURCHASE", "Tesla Supercharger", -18.50, 45281.50, None),
+        ("ACC-1004-CHK", "CUST-1004", "2026-02-20T10:00:00Z", "PAYMENT", "Credit card full payment", -5500.00, 45300.00, "ACC-1004-CRD"),
+        ("ACC-1004-CHK", "CUST-1004", "2026-02-15T08:00:00Z", "DEPOSIT", "Payroll - FinanceHub", 6250.00, 50800.00, None),
+        ("ACC-1004-CHK", "CUST-1004", "2026-02-10T11:00:00Z", "TRANSFER", "Brokerage transfer", -5000.00, 44550.00, None),
+    ]
+    _insert_rows(
+        conn,
+        "INSERT INTO transactions (account_id,customer_id,timestamp,type,description,amount,balance_after,related_account_id)",
+        txns,
+    )
+
+    # --- Payment history ---
+    payments = [
+        ("CUST-1001", "2025-12", 2500, 2500, 1), ("CUST-1001", "2025-11", 3100, 3100, 1),
+        ("CUST-1001", "2025-10", 1800, 1800, 1), ("CUST-1001", "2025-09", 2200, 2200, 1),
+        ("CUST-1001", "2025-08", 2700, 2700, 1), ("CUST-1001", "2025-07", 1900, 1900, 1),
+        ("CUST-1002", "2025-12", 1500, 1500, 1), ("CUST-1002", "2025-11", 1200, 1000, 0),
+        ("CUST-1002", "2025-10", 1800, 1800, 1), ("CUST-1002", "2025-09", 900, 900, 1),
+        ("CUST-1002", "2025-08", 2100, 1500, 0), ("CUST-1002", "2025-07", 1100, 1100, 1),
+        ("CUST-1003", "2025-12", 4200, 4200, 1), ("CUST-1003", "2025-11", 3800, 3800, 1),
+        ("CUST-1003", "2025-10", 5100, 5100, 1), ("CUST-1003", "2025-09", 2900, 2900, 1),
+        ("CUST-1003", "2025-08", 3500, 3000, 0), ("CUST-1003", "2025-07", 4000, 4000, 1),
+        ("CUST-1004", "2025-12", 5500, 5500, 1), ("CUST-1004", "2025-11", 4800, 4800, 1),
+        ("CUST-1004", "2025-10", 6200, 6200, 1), ("CUST-1004", "2025-09", 3900, 3900, 1),
+        ("CUST-1004", "2025-08", 5100, 5100, 1), ("CUST-1004", "2025-07", 4500, 4500, 1),
+    ]
+    _insert_rows(conn, "INSERT INTO payment_history (customer_id,month,amount_due,amount_paid,on_time)", payments)
+
+    # --- Seed some pending approvals ---
+    approvals = [
+        ("CUST-1002", "WIRE_TRANSFER", "Wire transfer to external account ending 4589", 3500.00, "2026-02-26T10:30:00Z", "PENDING"),
+        ("CUST-1003", "LARGE_PURCHASE", "Purchase authorization: Luxury Auto Dealer", 28500.00, "2026-02-26T11:00:00Z", "PENDING"),
+    ]
+    _insert_rows(
+        conn,
+        "INSERT INTO pending_approvals (customer_id,type,description,amount,timestamp,status)",
+        approvals,
+    )
 
-        existing = conn.execute("SELECT COUNT(*) FROM customers").fetchone()[0]
-        if existing > 0:
-            return
-
-        now = datetime.now(timezone.utc).isoformat()
-
-        # --- Customers ---
-        customers = [
-            ("CUST-1001", "Alice Johnson", "alice.johnson@solobank.com", "1234", 780, 10000, 48, 95000, 1200, 0.35, 1, 0),
-            ("CUST-1002", "Bob Martinez", "bob.martinez@solobank.com", "1234", 650, 5000, 18, 55000, 1800, 0.78, 4, 2),
-            ("CUST-1003", "Carol Chen", "carol.chen@solobank.com", "1234", 720, 15000, 36, 120000, 2500, 0.52, 2, 1),
-            ("CUST-1004", "David Park", "david.park@solobank.com", "1234", 820, 25000, 72, 150000, 3000, 0.22, 0, 0),
-        ]
-        conn.executemany("INSERT INTO customers VALUES (?,?,?,?,?,?,?,?,?,?,?,?)", customers)
-
-        # --- Accounts ---
-        accounts = [
-            ("ACC-1001-CHK", "CUST-1001", "checking", "Checking Account", 12450.00, "USD"),
-            ("ACC-1001-SAV", "CUST-1001", "savings", "Savings Account", 34200.00, "USD"),
-            ("ACC-1001-CRD", "CUST-1001", "credit", "Platinum Credit Card", -3500.00, "USD"),
-
-            ("ACC-1002-CHK", "CUST-1002", "checking", "Checking Account", 2100.00, "USD"),
-            ("ACC-1002-SAV", "CUST-1002", "savings", "Savings Account", 800.00, "USD"),
-            ("ACC-1002-CRD", "CUST-1002", "credit", "Gold Credit Card", -3900.00, "USD"),
-
-            ("ACC-1003-CHK", "CUST-1003", "checking", "Checking Account", 28700.00, "USD"),
-            ("ACC-1003-SAV", "CUST-1003", "savings", "Savings Account", 15600.00, "USD"),
-            ("ACC-1003-CRD", "CUST-1003", "credit", "Platinum Credit Card", -7800.00, "USD"),
-
-            ("ACC-1004-CHK", "CUST-1004", "checking", "Checking Account", 45300.00, "USD"),
-            ("ACC-1004-SAV", "CUST-1004", "savings", "Savings Account", 89000.00, "USD"),
-            ("ACC-1004-CRD", "CUST-1004", "credit", "Black Credit Card", -5500.00, "USD"),
-        ]
-        conn.executemany("INSERT INTO accounts VALUES (?,?,?,?,?,?)", accounts)
-
-        # --- Transactions ---
-        txns = [
-            ("ACC-1001-CHK", "CUST-1001", "2026-02-25T14:30:00Z", "PURCHASE", "Amazon - Electronics", -289.99, 12160.01, None),
-            ("ACC-1001-CHK", "CUST-1001", "2026-02-20T09:00:00Z", "PAYMENT", "Credit card payment", -2500.00, 12450.00, "ACC-1001-CRD"),
-            ("ACC-1001-CHK", "CUST-1001", "2026-02-15T08:00:00Z", "DEPOSIT", "Payroll - TechCorp Inc", 3958.33, 14950.00, None),
-            ("ACC-1001-CHK", "CUST-1001", "2026-02-10T12:15:00Z", "PURCHASE", "Whole Foods Market", -156.42, 10991.67, None),
-            ("ACC-1001-CHK", "CUST-1001", "2026-02-01T08:00:00Z", "PAYMENT", "Mortgage payment", -1800.00, 11148.09, None),
-            ("ACC-1001-SAV", "CUST-1001", "2026-02-15T08:05:00Z", "DEPOSIT", "Auto-save from checking", 500.00, 34200.00, "ACC-1001-CHK"),
-
-            ("ACC-1002-CHK", "CUST-1002", "2026-02-24T16:45:00Z", "PURCHASE", "Shell Gas Station", -62.50, 2037.50, None),
-            ("ACC-1002-CHK", "CUST-1002", "2026-02-18T10:00:00Z", "PAYMENT", "Minimum CC payment", -150.00, 2100.00, "ACC-1002-CRD"),
-            ("ACC-1002-CHK", "CUST-1002", "2026-02-15T08:00:00Z", "DEPOSIT", "Payroll - RetailMax", 2291.67, 2250.00, None),
-            ("ACC-1002-CHK", "CUST-1002", "2026-02-05T14:20:00Z", "WITHDRAWAL", "ATM Withdrawal", -200.00, -41.67, None),
-            ("ACC-1002-CRD", "CUST-1002", "2026-02-01T11:30:00Z", "PURCHASE", "Best Buy - 65\" TV", -899.99, -3900.00, None),
-
-            ("ACC-1003-CHK", "CUST-1003", "2026-02-26T09:10:00Z", "PURCHASE", "Delta Airlines - SFO to JFK", -487.00, 28213.00, None),
-            ("ACC-1003-CHK", "CUST-1003", "2026-02-22T10:00:00Z", "PAYMENT", "Credit card full payment", -4200.00, 28700.00, "ACC-1003-CRD"),
-            ("ACC-1003-CHK", "CUST-1003", "2026-02-15T08:00:00Z", "DEPOSIT", "Payroll - Acme Corp", 5000.00, 32900.00, None),
-            ("ACC-1003-CHK", "CUST-1003", "2026-02-08T15:30:00Z", "TRANSFER", "Transfer to savings", -2000.00, 27900.00, "ACC-1003-SAV"),
-            ("ACC-1003-SAV", "CUST-1003", "2026-02-08T15:30:00Z", "TRANSFER", "Transfer from checking", 2000.00, 15600.00, "ACC-1003-CHK"),
-
-            ("ACC-1004-CHK", "CUST-1004", "2026-02-25T07:30:00Z", "PURCHASE", "Tesla Supercharger", -18.50, 45281.50, None),
-            ("ACC-1004-CHK", "CUST-1004", "2026-02-20T10:00:00Z", "PAYMENT", "Credit card full payment", -5500.00, 45300.00, "ACC-1004-CRD"),
-            ("ACC-1004-CHK", "CUST-1004", "2026-02-15T08:00:00Z", "DEPOSIT", "Payroll - FinanceHub", 6250.00, 50800.00, None),
-            ("ACC-1004-CHK", "CUST-1004", "2026-02-10T11:00:00Z", "TRANSFER", "Brokerage transfer", -5000.00, 44550.00, None),
-        ]
-        conn.executemany(
-            "INSERT INTO transactions (account_id,customer_id,timestamp,type,description,amount,balance_after,related_account_id) VALUES (?,?,?,?,?,?,?,?)",
-            txns,
-        )
-
-        # --- Payment history ---
-        payments = [
-            ("CUST-1001", "2025-12", 2500, 2500, 1), ("CUST-1001", "2025-11", 3100, 3100, 1),
-            ("CUST-1001", "2025-10", 1800, 1800, 1), ("CUST-1001", "2025-09", 2200, 2200, 1),
-            ("CUST-1001", "2025-08", 2700, 2700, 1), ("CUST-1001", "2025-07", 1900, 1900, 1),
-            ("CUST-1002", "2025-12", 1500, 1500, 1), ("CUST-1002", "2025-11", 1200, 1000, 0),
-            ("CUST-1002", "2025-10", 1800, 1800, 1), ("CUST-1002", "2025-09", 900, 900, 1),
-            ("CUST-1002", "2025-08", 2100, 1500, 0), ("CUST-1002", "2025-07", 1100, 1100, 1),
-            ("CUST-1003", "2025-12", 4200, 4200, 1), ("CUST-1003", "2025-11", 3800, 3800, 1),
-            ("CUST-1003", "2025-10", 5100, 5100, 1), ("CUST-1003", "2025-09", 2900, 2900, 1),
-            ("CUST-1003", "2025-08", 3500, 3000, 0), ("CUST-1003", "2025-07", 4000, 4000, 1),
-            ("CUST-1004", "2025-12", 5500, 5500, 1), ("CUST-1004", "2025-11", 4800, 4800, 1),
-            ("CUST-1004", "2025-10", 6200, 6200, 1), ("CUST-1004", "2025-09", 3900, 3900, 1),
-            ("CUST-1004", "2025-08", 5100, 5100, 1), ("CUST-1004", "2025-07", 4500, 4500, 1),
-        ]
-        conn.executemany("INSERT INTO payment_history (customer_id,month,amount_due,amount_paid,on_time) VALUES (?,?,?,?,?)", payments)
-
-        # --- Seed some pending approvals ---
-        approvals = [
-            ("CUST-1002", "WIRE_TRANSFER", "Wire transfer to external account ending 4589", 3500.00, "2026-02-26T10:30:00Z", "PENDING"),
-            ("CUST-1003", "LARGE_PURCHASE", "Purchase authorization: Luxury Auto Dealer", 28500.00, "2026-02-26T11:00:00Z", "PENDING"),
-        ]
-        conn.executemany(
-            "INSERT INTO pending_approvals (customer_id,type,description,amount,timestamp,status) VALUES (?,?,?,?,?,?)",
-            approvals,
-        )
 
 
 # ---- Query helpers ----
 
+def _keyset_variants(sql: str, key: str = "timestamp, id") -> tuple[str, str]:
+    """(first page, later page) forms of a newest-first listing.
+
+    Pages continue from the (timestamp, id) of the previous page's last row, so
+    a deep page costs an index seek instead of OFFSET's skip-and-discard.
+    ``{}`` in ``sql`` marks where the cursor condition goes; ``key`` names the
+    (timestamp, id) columns, qualified if the query joins.
+    """
+    return sql.format(""), sql.format(f"AND ({key}) < (:before_ts, :before_id)")
+
+
+def _page_params(params: dict, limit: int, before: tuple[str, int] | None) -> dict:
+    params["limit"] = limit  # -1: no limit
+    if before is not None:
+        params["before_ts"], params["before_id"] = before
+    return params
+
+
+# Derived scalars are computed here once so callers don't redo the math.
+_SQL_CUSTOMER = """
+    SELECT c.*,
+        c.monthly_debt_payments * 12.0 / c.annual_income AS dti,
+        (SELECT AVG(on_time) FROM (
+            SELECT on_time FROM payment_history WHERE customer_id = c.id ORDER BY month DESC LIMIT 6
+        )) AS on_time_rate_6m
+    FROM customers c WHERE c.id = :customer_id
+"""
+
+# Timestamps are stamped by SQLite in the statement that writes them (UTC, ms,
+# same shape as the seed data) and read back with RETURNING where needed.
+_NOW = "strftime('%Y-%m-%dT%H:%M:%fZ', 'now')"
+
+# Statements shared by several helpers.
+# Write paths select only the columns they use.
+_SQL_CREDIT_LIMIT = "SELECT current_credit_limit FROM customers WHERE id = ?"
+_SQL_ACCOUNT = "SELECT type, balance FROM accounts WHERE id = ?"
+_SQL_ACCOUNT_BY_TYPE = "SELECT id, balance FROM accounts WHERE customer_id = ? AND type = ?"
+_SQL_INSERT_TXN = (
+    "INSERT INTO transactions (account_id,customer_id,timestamp,type,description,amount,balance_after,related_account_id) "
+    "VALUES (?,?,?,?,?,?,?,?)"
+)
+_SQL_INSERT_LIMIT_CHANGE = (
+    "INSERT INTO credit_limit_changes (customer_id,timestamp,old_limit,new_limit,reason,status,assessed_by) "
+    f"VALUES (?,{_NOW},?,?,?,?,?) RETURNING timestamp"
+)
+
+
+@_cached_read
 def get_customer(customer_id: str) -> dict | None:
-    with get_db() as conn:
-        row = conn.execute("SELECT * FROM customers WHERE id = ?", (customer_id,)).fetchone()
+    with get_read_db() as conn:
+        row = conn.execute(_SQL_CUSTOMER, {"customer_id": customer_id}).fetchone()
         return dict(row) if row else None
 
 
-def get_all_customers() -> list[dict]:
-    with get_db() as conn:
-        return [dict(r) for r in conn.execute("SELECT id, name, email FROM customers").fetchall()]
+_SQL_ALL_CUSTOMERS = "SELECT id, name, email FROM customers"
 
 
-def get_accounts(customer_id: str) -> list[dict]:
-    with get_db() as conn:
-        return [dict(r) for r in conn.execute("SELECT * FROM accounts WHERE customer_id = ?", (customer_id,)).fetchall()]
+def get_all_customers() -> list[sqlite3.Row]:
+    with get_read_db() as conn:
+        return conn.execute(_SQL_ALL_CUSTOMERS).fetchall()
 
 
-def get_transactions(account_id: str, limit: int = 20) -> list[dict]:
-    with get_db() as conn:
-        return [dict(r) for r in conn.execute(
-            "SELECT * FROM transactions WHERE account_id = ? ORDER BY timestamp DESC LIMIT ?",
-            (account_id, limit),
-        ).fetchall()]
+# rowid keeps accounts in the order they were opened (checking, savings, credit).
+_SQL_ACCOUNTS = "SELECT * FROM accounts WHERE customer_id = ? ORDER BY rowid"
 
 
-def get_all_transactions(customer_id: str, limit: int = 30) -> list[dict]:
-    with get_db() as conn:
-        return [dict(r) for r in conn.execute(
-            "SELECT t.*, a.name as account_name, a.type as account_type FROM transactions t "
-            "JOIN accounts a ON t.account_id = a.id "
-            "WHERE t.customer_id = ? ORDER BY t.timestamp DESC LIMIT ?",
-            (customer_id, limit),
-        ).fetchall()]
+@_cached_read
+def get_accounts(customer_id: str) -> list[sqlite3.Row]:
+    with get_read_db() as conn:
+        return conn.execute(_SQL_ACCOUNTS, (customer_id,)).fetchall()
 
 
-def transfer_funds(from_account_id: str, to_account_id: str, amount: float, description: str) -> dict:
-    now = datetime.now(timezone.utc).isoformat()
-    with get_db() as conn:
-        from_acc = conn.execute("SELECT * FROM accounts WHERE id = ?", (from_account_id,)).fetchone()
-        to_acc = conn.execute("SELECT * FROM accounts WHERE id = ?", (to_account_id,)).fetchone()
+_SQL_BALANCE_SUMMARY = """
+    SELECT COALESCE(SUM(CASE WHEN type <> 'credit' THEN balance ELSE 0 END), 0) AS total_assets,
+        COALESCE(SUM(CASE WHEN type = 'credit' THEN ABS(balance) ELSE 0 END), 0) AS total_credit_owed
+    FROM accounts WHERE customer_id = ?
+"""
 
-        if not from_acc or not to_acc:
-            return {"error": "Account not found"}
-        if from_acc["type"] == "credit":
-            return {"error": "Cannot transfer from a credit card account"}
-        if amount <= 0:
-            return {"error": "Amount must be positive"}
-        if from_acc["balance"] < amount:
-            return {"error": f"Insufficient funds. Available: ${from_acc['balance']:,.2f}"}
 
-        new_from = from_acc["balance"] - amount
-        new_to = to_acc["balance"] + amount
+def get_balance_summary(customer_id: str) -> dict:
+    with get_read_db() as conn:
+        return dict(conn.execute(_SQL_BALANCE_SUMMARY, (customer_id,)).fetchone())
 
-        conn.execute("UPDATE accounts SET balance = ? WHERE id = ?", (new_from, from_account_id))
-        conn.execute("UPDATE accounts SET balance = ? WHERE id = ?", (new_to, to_account_id))
 
-        conn.execute(
-            "INSERT INTO transactions (account_id,customer_id,timestamp,type,description,amount,balance_after,related_account_id) VALUES (?,?,?,?,?,?,?,?)",
+_SQL_ACCOUNT_TXNS = "SELECT * FROM transactions WHERE account_id = ? ORDER BY timestamp DESC, id DESC LIMIT ?"
+
+
+def get_transactions(account_id: str, limit: int = 20) -> list[sqlite3.Row]:
+    with get_read_db() as conn:
+        return conn.execute(_SQL_ACCOUNT_TXNS, (account_id, limit)).fetchall()
+
+
+_SQL_CUSTOMER_TXNS = "SELECT * FROM transactions WHERE customer_id = ? ORDER BY timestamp DESC, id DESC LIMIT ?"
+
+
+def get_all_transactions(customer_id: str, limit: int = 30) -> list[sqlite3.Row]:
+    with get_read_db() as conn:
+        return conn.execute(_SQL_CUSTOMER_TXNS, (customer_id, limit)).fetchall()
+
+
+_SQL_INSERT_TRANSFER = (
+    "INSERT INTO transfers (from_account_id,to_account_id,amount,description,timestamp) "
+    f"VALUES (?,?,?,?,{_NOW}) RETURNING timestamp"
+)
+
+
+# The debit checks the source type and balance in the same statement that
+# moves the money, so concurrent transfers can't overdraw an account.
+# RETURNING hands back a REAL that SQLite stored as an integer (e.g. 12350.0) as
+# a Python int; the casts keep balances floats in the API responses.
+# Balances are rounded to whole cents so float error can't accumulate.
+_SQL_DEBIT = """
+    UPDATE accounts SET balance = ROUND(balance - :amount, 2)
+    WHERE id = :id AND type <> 'credit' AND balance >= :amount
+    RETURNING customer_id, name, CAST(balance AS REAL) AS balance
+"""
+_SQL_CREDIT = """
+    UPDATE accounts SET balance = ROUND(balance + :amount, 2) WHERE id = :id
+    RETURNING customer_id, name, CAST(balance AS REAL) AS balance
+"""
+
+
+def transfer_funds(from_account_id: str, to_account_id: str, amount: float, description: str) -> dict:
+    amount = round(amount, 2)
+    if amount <= 0:
+        return {"error": "Amount must be positive"}
+    with get_write_db() as conn:
+        # Check the destination before the debit, so a rejected transfer writes nothing
+        if not conn.execute(_SQL_ACCOUNT, (to_account_id,)).fetchone():
+            return {"error": "Account not found"}
+        from_acc = conn.execute(_SQL_DEBIT, {"amount": amount, "id": from_account_id}).fetchone()
+        if not from_acc:
+            # Rejected: look the account up only to say why
+            acc = conn.execute(_SQL_ACCOUNT, (from_account_id,)).fetchone()
+            if not acc:
+                return {"error": "Account not found"}
+            if acc["type"] == "credit":
+                return {"error": "Cannot transfer from a credit card account"}
+            return {"error": f"Insufficient funds. Available: ${acc['balance']:,.2f}"}
+
+        to_acc = conn.execute(_SQL_CREDIT, {"amount": amount, "id": to_account_id}).fetchone()
+
+        new_from, new_to = from_acc["balance"], to_acc["balance"]
+        now = conn.execute(_SQL_INSERT_TRANSFER, (from_account_id, to_account_id, amount, description)).fetchone()[0]
+        conn.executemany(_SQL_INSERT_TXN, [
             (from_account_id, from_acc["customer_id"], now, "TRANSFER", f"Transfer to {to_acc['name']}: {description}", -amount, new_from, to_account_id),
-        )
-        conn.execute(
-            "INSERT INTO transactions (account_id,customer_id,timestamp,type,description,amount,balance_after,related_account_id) VALUES (?,?,?,?,?,?,?,?)",
             (to_account_id, to_acc["customer_id"], now, "TRANSFER", f"Transfer from {from_acc['name']}: {description}", amount, new_to, from_account_id),
-        )
-        conn.execute(
-            "INSERT INTO transfers (from_account_id,to_account_id,amount,description,timestamp) VALUES (?,?,?,?,?)",
-            (from_account_id, to_account_id, amount, description, now),
-        )
+        ])
 
     return {"status": "SUCCESS", "from_balance": new_from, "to_balance": new_to, "timestamp": now}
 
 
-def get_pending_approvals(customer_id: str) -> list[dict]:
-    with get_db() as conn:
-        return [dict(r) for r in conn.execute(
-            "SELECT * FROM pending_approvals WHERE customer_id = ? AND status = 'PENDING' ORDER BY timestamp DESC",
-            (customer_id,),
-        ).fetchall()]
+_SQL_PAYMENT_HISTORY = "SELECT * FROM payment_history WHERE customer_id = ? ORDER BY month DESC"
+
+
+def get_payment_history(customer_id: str) -> list[sqlite3.Row]:
+    with get_read_db() as conn:
+        return conn.execute(_SQL_PAYMENT_HISTORY, (customer_id,)).fetchall()
+
+
+_SQL_PAYMENT_SUMMARY = """
+    SELECT COUNT(*) AS total, COALESCE(SUM(on_time), 0) AS on_time
+    FROM payment_history WHERE customer_id = ?
+"""
+
+
+def get_payment_history_summary(customer_id: str) -> dict:
+    """On-time vs total payment counts, aggregated by SQLite."""
+    with get_read_db() as conn:
+        return dict(conn.execute(_SQL_PAYMENT_SUMMARY, (customer_id,)).fetchone())
+
+
+def _json_object(alias: str, columns: tuple[str, ...]) -> str:
+    return "json_object(" + ", ".join(f"'{c}', {alias}.{c}" for c in columns) + ")"
+
+
+_CUSTOMER_COLS = (
+    "id", "name", "email", "credit_score", "current_credit_limit", "account_age_months",
+    "annual_income", "monthly_debt_payments", "utilization_rate", "recent_inquiries",
+    "delinquencies_last_2y", "dti", "on_time_rate_6m",
+)
+_ACCOUNT_COLS = ("id", "customer_id", "type", "name", "balance", "currency")
+_TXN_COLS = (
+    "id", "account_id", "customer_id", "timestamp", "type", "description", "amount",
+    "balance_after", "related_account_id", "account_name", "account_type",
+)
+_PAYMENT_COLS = ("id", "customer_id", "month", "amount_due", "amount_paid", "on_time")
+_CREDIT_CHANGE_COLS = (
+    "id", "customer_id", "timestamp", "old_limit", "new_limit", "reason", "status", "assessed_by",
+)
+
+# Bundle sections as json_object values. Scalar subqueries drop SQLite's JSON
+# subtype, hence the json(...) wrappers.
+_BUNDLE_PARTS = {
+    "customer": _json_object("c", _CUSTOMER_COLS),
+    "accounts": f"""json((
+        SELECT json_group_array({_json_object("a", _ACCOUNT_COLS)})
+        FROM (SELECT * FROM accounts WHERE customer_id = c.id ORDER BY rowid) a
+    ))""",
+    "transactions": f"""json((
+        SELECT json_group_array({_json_object("t", _TXN_COLS)})
+        FROM (
+            SELECT * FROM transactions WHERE customer_id = c.id ORDER BY timestamp DESC, id DESC LIMIT :limit
+        ) t
+    ))""",
+    "payment_summary": """json((
+        SELECT json_object('total', COUNT(*), 'on_time', COALESCE(SUM(on_time), 0))
+        FROM payment_history WHERE customer_id = c.id
+    ))""",
+    "payment_history": f"""json((
+        SELECT json_group_array({_json_object("p", _PAYMENT_COLS)})
+        FROM (SELECT * FROM payment_history WHERE customer_id = c.id ORDER BY month DESC) p
+    ))""",
+    "credit_history": f"""json((
+        SELECT json_group_array({_json_object("h", _CREDIT_CHANGE_COLS)})
+        FROM (SELECT * FROM credit_limit_changes WHERE customer_id = c.id ORDER BY timestamp DESC, id DESC) h
+    ))""",
+}
+BUNDLE_FIELDS = tuple(_BUNDLE_PARTS)
+
+
+@functools.lru_cache(maxsize=64)
+def _bundle_sql(fields: tuple[str, ...]) -> str:
+    pairs = ", ".join(f"'{f}', {_BUNDLE_PARTS[f]}" for f in fields)
+    return f"SELECT json_object({pairs}) FROM ({_SQL_CUSTOMER}) c"
+
+
+def get_customer_bundle_json(
+    customer_id: str, limit: int = 30, fields: tuple[str, ...] = BUNDLE_FIELDS,
+) -> str | None:
+    """Customer bundle rendered to JSON by SQLite, ready to send as-is.
+
+    Only the requested sections are queried; ``fields`` must come from BUNDLE_FIELDS.
+    """
+    with get_read_db() as conn:
+        row = conn.execute(_bundle_sql(fields), {"customer_id": customer_id, "limit": limit}).fetchone()
+        return row[0] if row else None
+
+
+_SQL_PENDING_APPROVALS = (
+    "SELECT * FROM pending_approvals WHERE customer_id = ? AND status = 'PENDING' ORDER BY timestamp DESC, id DESC"
+)
+
+
+def get_pending_approvals(customer_id: str) -> list[sqlite3.Row]:
+    with get_read_db() as conn:
+        return conn.execute(_SQL_PENDING_APPROVALS, (customer_id,)).fetchall()
+
+
+_SQL_APPROVAL = (
+    "SELECT customer_id, status, type, amount, description, target_account_id FROM pending_approvals WHERE id = ?"
+)
+_SQL_APPLY_APPROVAL = "UPDATE accounts SET balance = ROUND(balance - ?, 2) WHERE id = ? RETURNING CAST(balance AS REAL)"
+_SQL_RESOLVE_APPROVAL = (
+    f"UPDATE pending_approvals SET status = ?, resolved_at = {_NOW}, resolved_by = ? WHERE id = ? RETURNING resolved_at"
+)
+_SQL_DENY_LIMIT_CHANGE = (
+    "UPDATE credit_limit_changes SET status = 'DENIED' "
+    "WHERE customer_id = ? AND new_limit = ? AND status = 'PENDING_REVIEW'"
+)
 
 
 def resolve_approval(approval_id: int, action: str, resolved_by: str = "customer") -> dict:
-    now = datetime.now(timezone.utc).isoformat()
-    with get_db() as conn:
-        row = conn.execute("SELECT * FROM pending_approvals WHERE id = ?", (approval_id,)).fetchone()
+    with get_write_db() as conn:
+        row = conn.execute(_SQL_APPROVAL, (approval_id,)).fetchone()
         if not row:
             return {"error": "Approval not found"}
         if row["status"] != "PENDING":
             return {"error": f"Already resolved: {row['status']}"}
 
         status = "APPROVED" if action == "approve" else "DENIED"
-        conn.execute(
-            "UPDATE pending_approvals SET status = ?, resolved_at = ?, resolved_by = ? WHERE id = ?",
-            (status, now, resolved_by, approval_id),
-        )
+        now = conn.execute(_SQL_RESOLVE_APPROVAL, (status, resolved_by, approval_id)).fetchone()[0]
 
         if status == "APPROVED":
             if row["type"] == "CREDIT_LIMIT_INCREASE":
@@ -314,61 +672,63 @@ def resolve_approval(approval_id: int, action: str, resolved_by: str = "customer
                     return result
             else:
                 # Execute the approved transaction (wire transfer, large purchase)
-                checking = conn.execute(
-                    "SELECT * FROM accounts WHERE customer_id = ? AND type = 'checking'",
-                    (row["customer_id"],),
-                ).fetchone()
-                if checking:
-                    new_balance = checking["balance"] - row["amount"]
-                    conn.execute("UPDATE accounts SET balance = ? WHERE id = ?", (new_balance, checking["id"]))
+                if target := row["target_account_id"]:
+                    new_balance = conn.execute(_SQL_APPLY_APPROVAL, (row["amount"], target)).fetchone()[0]
                     conn.execute(
-                        "INSERT INTO transactions (account_id,customer_id,timestamp,type,description,amount,balance_after) VALUES (?,?,?,?,?,?,?)",
-                        (checking["id"], row["customer_id"], now, row["type"], f"Approved: {row['description']}", -row["amount"], new_balance),
+                        _SQL_INSERT_TXN,
+                        (target, row["customer_id"], now, row["type"], f"Approved: {row['description']}", -row["amount"], new_balance, None),
                     )
         elif status == "DENIED" and row["type"] == "CREDIT_LIMIT_INCREASE":
             # Record denial in credit limit history
-            conn.execute(
-                "UPDATE credit_limit_changes SET status = 'DENIED' WHERE customer_id = ? AND new_limit = ? AND status = 'PENDING_REVIEW'",
-                (row["customer_id"], row["amount"]),
-            )
+            conn.execute(_SQL_DENY_LIMIT_CHANGE, (row["customer_id"], row["amount"]))
 
     return {"status": status, "approval_id": approval_id, "timestamp": now}
 
 
-def get_all_pending_approvals() -> list[dict]:
-    with get_db() as conn:
-        return [dict(r) for r in conn.execute(
-            "SELECT pa.*, c.name as customer_name FROM pending_approvals pa "
-            "JOIN customers c ON pa.customer_id = c.id "
-            "WHERE pa.status = 'PENDING' ORDER BY pa.timestamp DESC",
-        ).fetchall()]
+# Carries the customer details a reviewer needs, so the admin view doesn't
+# follow up with a customer lookup per approval.
+_SQL_ALL_PENDING_APPROVALS = _keyset_variants("""
+    SELECT pa.*, c.email AS customer_email, c.credit_score, c.current_credit_limit
+    FROM pending_approvals pa JOIN customers c ON c.id = pa.customer_id
+    WHERE pa.status = 'PENDING' {} ORDER BY pa.timestamp DESC, pa.id DESC LIMIT :limit
+""", key="pa.timestamp, pa.id")
+
+
+def get_all_pending_approvals(limit: int = -1, before: tuple[str, int] | None = None) -> list[sqlite3.Row]:
+    """Pending approvals, newest first; page with ``limit`` and a ``before`` cursor."""
+    with get_read_db() as conn:
+        return conn.execute(_SQL_ALL_PENDING_APPROVALS[before is not None], _page_params({}, limit, before)).fetchall()
+
+
+_SQL_INSERT_APPROVAL = (
+    "INSERT INTO pending_approvals (customer_id,type,description,amount,timestamp,status) "
+    f"VALUES (?,?,?,?,{_NOW},?)"
+)
 
 
 def create_credit_limit_approval(
-    customer_id: str, requested_new_limit: float, current_limit: float,
-    reason: str, assessment_summary: str,
+    customer_id: str, requested_new_limit: float, reason: str, assessment_summary: str,
 ) -> dict:
-    now = datetime.now(timezone.utc).isoformat()
-    with get_db() as conn:
-        customer = conn.execute("SELECT * FROM customers WHERE id = ?", (customer_id,)).fetchone()
+    with get_write_db() as conn:
+        customer = conn.execute(_SQL_CREDIT_LIMIT, (customer_id,)).fetchone()
         if not customer:
             return {"error": "Customer not found"}
+        current_limit = customer["current_credit_limit"]
 
         description = (
             f"Credit limit increase: ${current_limit:,.2f} → ${requested_new_limit:,.2f}. "
             f"Reason: {reason}. Assessment: {assessment_summary}"
         )
-        conn.execute(
-            "INSERT INTO pending_approvals (customer_id,type,description,amount,timestamp,status) VALUES (?,?,?,?,?,?)",
-            (customer_id, "CREDIT_LIMIT_INCREASE", description, requested_new_limit, now, "PENDING"),
-        )
-        approval_id = conn.execute("SELECT last_insert_rowid()").fetchone()[0]
+        approval_id = conn.execute(
+            _SQL_INSERT_APPROVAL,
+            (customer_id, "CREDIT_LIMIT_INCREASE", description, requested_new_limit, "PENDING"),
+        ).lastrowid
 
         # Record in credit_limit_changes as PENDING
         conn.execute(
-            "INSERT INTO credit_limit_changes (customer_id,timestamp,old_limit,new_limit,reason,status,assessed_by) VALUES (?,?,?,?,?,?,?)",
-            (customer_id, now, current_limit, requested_new_limit, reason, "PENDING_REVIEW", "credit-assessment-agent"),
-        )
+            _SQL_INSERT_LIMIT_CHANGE,
+            (customer_id, current_limit, requested_new_limit, reason, "PENDING_REVIEW", "credit-assessment-agent"),
+        ).fetchone()
 
     return {
         "status": "PENDING_REVIEW",
@@ -379,18 +739,30 @@ def create_credit_limit_approval(
     }
 
 
-def get_credit_limit_history(customer_id: str) -> list[dict]:
-    with get_db() as conn:
-        return [dict(r) for r in conn.execute(
-            "SELECT * FROM credit_limit_changes WHERE customer_id = ? ORDER BY timestamp DESC",
-            (customer_id,),
-        ).fetchall()]
+_SQL_CREDIT_HISTORY = _keyset_variants(
+    "SELECT * FROM credit_limit_changes WHERE customer_id = :customer_id {} ORDER BY timestamp DESC, id DESC LIMIT :limit"
+)
+
+
+def get_credit_limit_history(
+    customer_id: str, limit: int = -1, before: tuple[str, int] | None = None,
+) -> list[sqlite3.Row]:
+    """Credit limit changes, newest first; page with ``limit`` and a ``before`` cursor."""
+    with get_read_db() as conn:
+        params = _page_params({"customer_id": customer_id}, limit, before)
+        return conn.execute(_SQL_CREDIT_HISTORY[before is not None], params).fetchall()
+
+
+# Utilization is left as-is when the customer has no credit account (NULL).
+_SQL_SET_CREDIT_LIMIT = """
+    UPDATE customers SET current_credit_limit = ?, utilization_rate = COALESCE(?, utilization_rate)
+    WHERE id = ?
+"""
 
 
 def update_credit_limit(customer_id: str, new_limit: float, reason: str, assessed_by: str = "credit-assessment-agent") -> dict:
-    now = datetime.now(timezone.utc).isoformat()
-    with get_db() as conn:
-        customer = conn.execute("SELECT * FROM customers WHERE id = ?", (customer_id,)).fetchone()
+    with get_write_db() as conn:
+        customer = conn.execute(_SQL_CREDIT_LIMIT, (customer_id,)).fetchone()
         if not customer:
             return {"error": "Customer not found"}
 
@@ -400,28 +772,25 @@ def update_credit_limit(customer_id: str, new_limit: float, reason: str, assesse
         if new_limit > old_limit * 3:
             return {"error": f"Cannot increase by more than 3x. Current: ${old_limit:,.2f}, Max: ${old_limit * 3:,.2f}"}
 
-        conn.execute("UPDATE customers SET current_credit_limit = ? WHERE id = ?", (new_limit, customer_id))
-
         # Update utilization rate based on new limit
-        credit_acc = conn.execute(
-            "SELECT * FROM accounts WHERE customer_id = ? AND type = 'credit'", (customer_id,)
-        ).fetchone()
+        credit_acc = conn.execute(_SQL_ACCOUNT_BY_TYPE, (customer_id, "credit")).fetchone()
+        new_util = None
         if credit_acc:
-            new_util = abs(credit_acc["balance"]) / new_limit if new_limit > 0 else 0
-            conn.execute("UPDATE customers SET utilization_rate = ? WHERE id = ?", (round(new_util, 4), customer_id))
+            new_util = round(abs(credit_acc["balance"]) / new_limit if new_limit > 0 else 0, 4)
+        conn.execute(_SQL_SET_CREDIT_LIMIT, (new_limit, new_util, customer_id))
 
-        conn.execute(
-            "INSERT INTO credit_limit_changes (customer_id,timestamp,old_limit,new_limit,reason,status,assessed_by) VALUES (?,?,?,?,?,?,?)",
-            (customer_id, now, old_limit, new_limit, reason, "APPROVED", assessed_by),
-        )
+        now = conn.execute(
+            _SQL_INSERT_LIMIT_CHANGE,
+            (customer_id, old_limit, new_limit, reason, "APPROVED", assessed_by),
+        ).fetchone()[0]
 
         # Record as a transaction on the credit account
         if credit_acc:
             conn.execute(
-                "INSERT INTO transactions (account_id,customer_id,timestamp,type,description,amount,balance_after) VALUES (?,?,?,?,?,?,?)",
+                _SQL_INSERT_TXN,
                 (credit_acc["id"], customer_id, now, "CREDIT_LIMIT_CHANGE",
                  f"Credit limit increased: ${old_limit:,.2f} → ${new_limit:,.2f} ({reason})",
-                 new_limit - old_limit, credit_acc["balance"]),
+                 new_limit - old_limit, credit_acc["balance"], None),
             )
 
     return {
@@ -434,6 +803,3 @@ def update_credit_limit(customer_id: str, new_limit: float, reason: str, assesse
         "assessed_by": assessed_by,
         "timestamp": now,
     }
-
-
-init_db()